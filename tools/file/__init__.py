@@ -1,3 +1,4 @@
 from .filemanager import FileManager
 from .data_comparator import DataComparator 
-from .github import GitMgt
+from .github import GitMgt, GitHubSession
+from .diskcache import DiskCache
@@ -1,3 +1,8 @@
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import numpy as np
 import pandas as pd
 import logging
 
@@ -30,3 +35,250 @@ class DataComparator:
         logging.info(f"차이가 있는 항목: {diff_items}")
         print(f"두 행 간의 값이 같은지 여부: {are_equal}")
         print(f"차이가 있는 항목: {diff_items}")
+
+    @staticmethod
+    def _column_change_mask(old: pd.Series, new: pd.Series, atol=0.0, rtol=0.0, nan_equal=True) -> np.ndarray:
+        """
+        두 열을 원소별로 비교해 값이 바뀐 위치를 True로 표시한 배열을 반환한다.
+        숫자 열은 atol/rtol 허용 오차 안이면 같은 값으로 본다.
+        정수 열끼리는 허용 오차가 없으면 float64로 바꾸지 않고 그대로 비교한다 (2^53보다 큰 ID, 타임스탬프 등).
+        """
+        old_na = old.isna().to_numpy()
+        new_na = new.isna().to_numpy()
+        is_int = pd.api.types.is_integer_dtype
+        if is_int(old) and is_int(new) and atol == 0 and rtol == 0:
+            # 결측 위치는 아래에서 따로 처리하므로 임시 값 0으로 채운다
+            changed = old.to_numpy(dtype="int64", na_value=0) != new.to_numpy(dtype="int64", na_value=0)
+        elif pd.api.types.is_numeric_dtype(old) and pd.api.types.is_numeric_dtype(new) \
+                and not pd.api.types.is_bool_dtype(old) and not pd.api.types.is_bool_dtype(new):
+            a = old.to_numpy(dtype="float64", na_value=np.nan)
+            b = new.to_numpy(dtype="float64", na_value=np.nan)
+            with np.errstate(invalid="ignore"):
+                changed = ~np.isclose(a, b, rtol=rtol, atol=atol, equal_nan=False)
+        else:
+            changed = (old.to_numpy(dtype=object) != new.to_numpy(dtype=object))
+        both_na = old_na & new_na
+        changed = np.where(both_na, not nan_equal, changed | (old_na != new_na))
+        return changed.astype(bool)
+
+    @staticmethod
+    def _row_hashes(frame: pd.DataFrame) -> np.ndarray:
+        try:
+            return pd.util.hash_pandas_object(frame, index=False).to_numpy()
+        except TypeError:
+            # 리스트/딕셔너리처럼 해시할 수 없는 값이 있으면 문자열로 바꿔 해시한다
+            return pd.util.hash_pandas_object(frame.astype(str), index=False).to_numpy()
+
+    @staticmethod
+    def diff_frames(df_old: pd.DataFrame, df_new: pd.DataFrame, keys, columns=None,
+                    atol=0.0, rtol=0.0, nan_equal=True) -> dict:
+        """
+        두 DataFrame을 키 열로 맞춰 추가/삭제/변경된 행을 찾는다.
+        행 해시로 같은 행을 먼저 걸러낸 뒤, 해시가 다른 행만 열별로 비교한다.
+
+        # 예시
+        result = DataComparator.diff_frames(yesterday, today, keys=["model"], atol=1e-9)
+        result["counts"]        # {'added': 3, 'removed': 1, 'changed': 12, 'unchanged': 985, 'columns': {...}}
+        result["change_mask"]   # 변경된 행의 열별 변경 여부 (bool DataFrame, 인덱스는 키)
+
+        Args:
+            df_old (pd.DataFrame): 기준(이전) 데이터
+            df_new (pd.DataFrame): 비교할(새) 데이터
+            keys (str | list): 행을 맞출 키 열. 두 DataFrame에서 유일해야 한다
+            columns (list): 비교할 열. None이면 키를 제외한 공통 열 전체
+            atol, rtol (float): 숫자 열의 절대/상대 허용 오차
+            nan_equal (bool): True이면 양쪽 모두 NaN인 값을 같은 값으로 본다
+
+        Returns:
+            dict: added, removed (DataFrame), changed_old, changed_new (변경된 행의 이전/새 값),
+                  change_mask (bool DataFrame), columns_added, columns_removed (list), counts (dict)
+        """
+        keys = [keys] if isinstance(keys, str) else list(keys)
+        old = df_old.set_index(keys)
+        new = df_new.set_index(keys)
+        for name, frame in (("df_old", old), ("df_new", new)):
+            if not frame.index.is_unique:
+                raise ValueError(f"{name}의 키 {keys}가 유일하지 않습니다.")
+
+        if columns is None:
+            columns = [column for column in old.columns if column in new.columns]
+        columns_added = [column for column in new.columns if column not in old.columns]
+        columns_removed = [column for column in old.columns if column not in new.columns]
+
+        added = new.loc[new.index.difference(old.index, sort=False)]
+        removed = old.loc[old.index.difference(new.index, sort=False)]
+        common = old.index.intersection(new.index, sort=False)
+        old_common = old.loc[common, columns]
+        new_common = new.loc[common, columns]
+
+        # 해시가 같으면 값도 같으므로 해시가 다른 행만 자세히 비교한다
+        if not columns:
+            candidates = np.zeros(len(common), dtype=bool)  # 키만 있으면 변경된 행이 없다
+        else:
+            candidates = DataComparator._row_hashes(old_common) != DataComparator._row_hashes(new_common)
+        if columns and not nan_equal:
+            # NaN끼리는 해시가 같으므로 NaN이 있는 행도 비교 대상에 넣는다
+            candidates |= (old_common.isna().to_numpy() & new_common.isna().to_numpy()).any(axis=1)
+
+        old_cand = old_common[candidates]
+        new_cand = new_common[candidates]
+        mask = pd.DataFrame(
+            {column: DataComparator._column_change_mask(old_cand[column], new_cand[column], atol, rtol, nan_equal)
+             for column in columns},
+            index=old_cand.index, columns=columns)
+        changed_rows = mask.any(axis=1).to_numpy() if columns else np.zeros(len(mask), dtype=bool)
+        mask = mask[changed_rows]
+
+        counts = {
+            "added": len(added),
+            "removed": len(removed),
+            "changed": int(changed_rows.sum()),
+            "unchanged": len(common) - int(changed_rows.sum()),
+            "columns": {column: int(mask[column].sum()) for column in columns},
+        }
+        logging.info(f"diff 결과: {counts}")
+        return {
+            "added": added,
+            "removed": removed,
+            "changed_old": old_cand[changed_rows],
+            "changed_new": new_cand[changed_rows],
+            "change_mask": mask,
+            "columns_added": columns_added,
+            "columns_removed": columns_removed,
+            "counts": counts,
+        }
+
+    @staticmethod
+    def _iter_chunks(source, chunk_size=100_000, columns=None, **read_kwargs):
+        """
+        파일(.parquet 또는 csv) 또는 DataFrame 반복자를 chunk_size 행씩 읽는 제너레이터.
+        """
+        if not isinstance(source, (str, Path)):
+            yield from source
+            return
+        if str(source).endswith(".parquet"):
+            import pyarrow.parquet as pq
+            for batch in pq.ParquetFile(source).iter_batches(batch_size=chunk_size, columns=columns):
+                yield batch.to_pandas()
+        else:
+            yield from pd.read_csv(source, chunksize=chunk_size, usecols=columns, **read_kwargs)
+
+    @staticmethod
+    def _key_buckets(key_frame, num_buckets):
+        """
+        키 열을 정규화한 뒤 해시해 행별 버킷 번호를 반환한다.
+        hash_pandas_object는 자료형에 따라 값이 달라지므로(1과 1.0), 숫자 열은 float64로, 나머지는 문자열로 맞춘다.
+        """
+        normalized = {}
+        for column in key_frame.columns:
+            values = key_frame[column]
+            if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+                normalized[column] = values.astype("float64")
+            else:
+                normalized[column] = values.astype(str)
+        return pd.util.hash_pandas_object(pd.DataFrame(normalized), index=False).to_numpy() % num_buckets
+
+    @staticmethod
+    def _partition(source, keys, num_buckets, bucket_dir, chunk_size, columns, read_kwargs, key_dtype=None) -> int:
+        """
+        입력을 키 해시로 num_buckets개의 디스크 버킷에 나눠 쓰고 읽은 행 수를 반환한다.
+        key_dtype이 있으면 키 열을 그 자료형으로 바꾼 뒤 나눈다.
+        """
+        rows = 0
+        for part, chunk in enumerate(DataComparator._iter_chunks(source, chunk_size, columns, **read_kwargs)):
+            if key_dtype is not None:
+                chunk = chunk.astype({key: key_dtype for key in keys})
+            buckets = DataComparator._key_buckets(chunk[keys], num_buckets)
+            for bucket, group in chunk.groupby(buckets, sort=False):
+                group.to_pickle(os.path.join(bucket_dir, f"{bucket}", f"{part}.pickle"))
+            rows += len(chunk)
+        return rows
+
+    @staticmethod
+    def _read_bucket(bucket_dir, columns):
+        parts = sorted(Path(bucket_dir).glob("*.pickle"))
+        if not parts:
+            return pd.DataFrame(columns=columns)
+        return pd.concat([pd.read_pickle(part) for part in parts], ignore_index=True)
+
+    @staticmethod
+    def _diff_bucket(args) -> pd.DataFrame:
+        old_dir, new_dir, keys, columns, atol, rtol, nan_equal = args
+        old = DataComparator._read_bucket(old_dir, columns)
+        new = DataComparator._read_bucket(new_dir, columns)
+        if old.empty and new.empty:
+            return pd.DataFrame(columns=keys + ["status", "changed_columns"])
+        if old.empty:
+            old = new.iloc[0:0]
+        if new.empty:
+            new = old.iloc[0:0]
+        compare_columns = [c for c in old.columns if c in new.columns and c not in keys]
+
+        result = DataComparator.diff_frames(old, new, keys, columns=compare_columns,
+                                            atol=atol, rtol=rtol, nan_equal=nan_equal)
+        mask = result["change_mask"]
+        changed_columns = [",".join(mask.columns[row]) for row in mask.to_numpy()]
+        frames = [
+            result["added"].index.to_frame(index=False).assign(status="added", changed_columns=""),
+            result["removed"].index.to_frame(index=False).assign(status="removed", changed_columns=""),
+            mask.index.to_frame(index=False).assign(status="changed", changed_columns=changed_columns),
+        ]
+        return pd.concat(frames, ignore_index=True)
+
+    @staticmethod
+    def diff_files_chunked(old_source, new_source, keys, columns=None, num_buckets=64, chunk_size=100_000,
+                           work_dir=None, max_workers=1, atol=0.0, rtol=0.0, nan_equal=True, key_dtype=None,
+                           **read_kwargs):
+        """
+        메모리보다 큰 두 데이터셋을 키 해시로 디스크 버킷에 나눈 뒤 버킷 쌍별로 비교하는 제너레이터.
+        최대 메모리는 전체 데이터가 아니라 버킷 한 쌍(× max_workers) 크기에 비례한다.
+
+        # 예시
+        for changes in DataComparator.diff_files_chunked("old.parquet", "new.parquet", keys=["id"], max_workers=4):
+            changes[changes["status"] == "changed"]
+
+        Args:
+            old_source, new_source: .parquet/csv 파일 경로 또는 DataFrame 조각 반복자
+            keys (str | list): 행을 맞출 키 열. 숫자 키는 정수/실수 자료형이 달라도 같은 버킷에 들어간다
+            columns (list): 읽을 열 (키 포함). None이면 모든 열. 키 열만 있으면 추가/삭제된 키만 찾는다
+            num_buckets (int): 디스크 버킷 수. 버킷 하나가 메모리에 들어갈 만큼 크게 잡는다
+            chunk_size (int): 입력을 나눠 읽을 행 수
+            work_dir (str | Path): 버킷 임시 폴더를 만들 위치. None이면 시스템 임시 폴더
+            max_workers (int): 1보다 크면 버킷 쌍을 프로세스 풀에서 동시에 비교
+            atol, rtol, nan_equal: diff_frames와 같다
+            key_dtype: 키 열을 바꿀 자료형 (예: str). 한쪽은 숫자, 다른 쪽은 문자열로 읽히는 키를 맞출 때 사용
+            read_kwargs: csv일 때 pd.read_csv에 넘길 인자 (예: dtype)
+
+        Yields:
+            pd.DataFrame: 버킷별 변경 키. 키 열 + status("added"/"removed"/"changed") + changed_columns
+        """
+        keys = [keys] if isinstance(keys, str) else list(keys)
+        with tempfile.TemporaryDirectory(dir=work_dir, prefix="diff_buckets_") as tmp_dir:
+            dirs = {}
+            for side, source in (("old", old_source), ("new", new_source)):
+                dirs[side] = os.path.join(tmp_dir, side)
+                for bucket in range(num_buckets):
+                    os.makedirs(os.path.join(dirs[side], f"{bucket}"))
+                rows = DataComparator._partition(source, keys, num_buckets, dirs[side], chunk_size, columns,
+                                                 read_kwargs, key_dtype)
+                logging.info(f"{side} 입력 {rows}행을 {num_buckets}개 버킷으로 나눴습니다.")
+
+            tasks = [(os.path.join(dirs["old"], f"{bucket}"), os.path.join(dirs["new"], f"{bucket}"),
+                      keys, columns, atol, rtol, nan_equal) for bucket in range(num_buckets)]
+            totals = {"added": 0, "removed": 0, "changed": 0}
+            if max_workers > 1:
+                executor = ProcessPoolExecutor(max_workers=max_workers)
+                results = executor.map(DataComparator._diff_bucket, tasks)
+            else:
+                executor = None
+                results = map(DataComparator._diff_bucket, tasks)
+            try:
+                for changes in results:
+                    for status, count in changes["status"].value_counts().items():
+                        totals[status] += int(count)
+                    if not changes.empty:
+                        yield changes
+            finally:
+                if executor is not None:
+                    executor.shutdown(cancel_futures=True)
+            logging.info(f"chunked diff 결과: {totals}")
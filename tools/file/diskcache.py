@@ -0,0 +1,304 @@
+import functools
+import hashlib
+import inspect
+import logging
+import os
+import pickle
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from .filemanager import FileManager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class DiskCache:
+    """
+    함수 결과를 FileManager 직렬화로 디스크에 저장하는 캐시.
+    키는 함수 이름(module.qualname)과 인자의 안정적인 해시로 만들며,
+    TTL, 전체 크기 제한(LRU 제거), 프로세스 간 파일 잠금을 지원한다.
+
+    # 예시
+    cache = DiskCache("cache", ttl=3600, max_bytes=2 * 1024 ** 3)
+
+    @cache.memoize
+    def scrape(url):
+        ...
+
+    @cache.memoize(ttl=60)
+    def transform(df):
+        ...
+
+    class Client:
+        @cache.memoize(ignore=("self",))  # 해시할 수 없는 self는 키에서 뺀다
+        def fetch(self, url):
+            ...
+
+    print(cache.stats())
+    """
+
+    def __init__(self, cache_dir="cache", ttl: float = None, max_bytes: int = None, backend="pickle",
+                 compression=None):
+        """
+        Args:
+            cache_dir (str | Path): 캐시 파일을 저장할 폴더
+            ttl (float): 기본 유효 시간(초). None이면 만료되지 않는다
+            max_bytes (int): 캐시 폴더의 최대 크기(바이트). 넘으면 오래 사용하지 않은 항목부터 삭제
+            backend (str): FileManager.save_data의 backend ("pickle", "oob", "feather", "npy", "auto")
+            compression (str): FileManager.save_data의 compression ("zstd", "lz4" 등)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.backend = backend
+        self.compression = compression
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _update_hash(digest, obj):
+        # pickle 결과는 dict/set 순서에 따라 달라질 수 있으므로 자료형별로 직접 해시한다
+        if isinstance(obj, pd.DataFrame):
+            digest.update(b"DataFrame")
+            DiskCache._update_hash(digest, [str(c) for c in obj.columns])
+            digest.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+        elif isinstance(obj, pd.Series):
+            digest.update(b"Series")
+            digest.update(str(obj.name).encode("utf-8"))
+            digest.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+        elif isinstance(obj, np.ndarray):
+            digest.update(f"ndarray{obj.dtype}{obj.shape}".encode("utf-8"))
+            digest.update(np.ascontiguousarray(obj).tobytes())
+        elif isinstance(obj, dict):
+            digest.update(b"dict")
+            items = sorted(((DiskCache._stable_hash(k), v) for k, v in obj.items()), key=lambda item: item[0])
+            for key_hash, value in items:
+                digest.update(key_hash.encode("ascii"))
+                DiskCache._update_hash(digest, value)
+        elif isinstance(obj, (set, frozenset)):
+            digest.update(b"set")
+            for item_hash in sorted(DiskCache._stable_hash(item) for item in obj):
+                digest.update(item_hash.encode("ascii"))
+        elif isinstance(obj, (list, tuple)):
+            digest.update(type(obj).__name__.encode("utf-8") + str(len(obj)).encode("ascii"))
+            for item in obj:
+                DiskCache._update_hash(digest, item)
+        elif isinstance(obj, (str, bytes, int, float, bool, type(None))):
+            digest.update(f"{type(obj).__name__}:{obj!r}".encode("utf-8"))
+        else:
+            digest.update(pickle.dumps(obj, protocol=4))
+
+    @staticmethod
+    def _stable_hash(obj) -> str:
+        digest = hashlib.sha256()
+        DiskCache._update_hash(digest, obj)
+        return digest.hexdigest()
+
+    def make_key(self, func, args, kwargs) -> str:
+        """
+        함수와 인자로 캐시 키를 만드는 함수.
+        해시할 수 없는 인자가 있으면 어떤 인자인지 알려주는 TypeError를 발생시킨다.
+        """
+        name = f"{func.__module__}.{func.__qualname__}"
+        try:
+            key_hash = self._stable_hash((name, args, kwargs))
+        except (TypeError, AttributeError, pickle.PicklingError) as e:
+            labeled = [(f"위치 인자 {i}", arg) for i, arg in enumerate(args)] + list(kwargs.items())
+            for label, arg in labeled:
+                try:
+                    self._stable_hash(arg)
+                except (TypeError, AttributeError, pickle.PicklingError):
+                    break
+            else:
+                label, arg = "알 수 없는 인자", None
+            raise TypeError(f"{name}의 '{label}'({type(arg).__name__})를 캐시 키로 해시할 수 없습니다. "
+                            f"memoize(ignore=...)로 키에서 제외하세요: {e}") from e
+        return f"{func.__name__}-{key_hash[:40]}"
+
+    @staticmethod
+    def _drop_ignored(signature, args, kwargs, ignore):
+        """
+        ignore에 있는 인자(이름 또는 위치)를 뺀 (args, kwargs)를 반환한다. 키는 인자 이름으로 만든다.
+        """
+        bound = signature.bind(*args, **kwargs)
+        names = list(signature.parameters)
+        ignored = {names[item] if isinstance(item, int) else item for item in ignore}
+        return (), {name: value for name, value in bound.arguments.items() if name not in ignored}
+
+    def _entry_path(self, key):
+        for extension in FileManager.SERIALIZATION_BACKENDS.values():
+            path = self.cache_dir / f"{key}.{extension}"
+            if path.exists():
+                return path
+        return None
+
+    # 키별 잠금 파일이 쌓이지 않도록 키를 고정된 수의 잠금 파일에 나눠 배정한다
+    LOCK_STRIPES = 64
+
+    @contextmanager
+    def _lock(self, name):
+        # 같은 키를 여러 프로세스가 동시에 계산하거나 쓰지 않도록 잠금 파일을 사용한다
+        with open(self.cache_dir / f".{name}.lock", "a+b") as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+                else:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def _count(self, name, n=1):
+        with self._stats_lock:
+            setattr(self, name, getattr(self, name) + n)
+
+    def _load(self, key, ttl):
+        """
+        유효한 캐시 값이 있으면 (True, 값), 없으면 (False, None)을 반환한다.
+        수정 시각은 저장 시각(TTL), 접근 시각은 마지막 사용 시각(LRU)으로 쓴다.
+        """
+        path = self._entry_path(key)
+        if path is None:
+            return False, None
+        try:
+            stat = path.stat()
+        except FileNotFoundError:  # 다른 프로세스가 방금 삭제한 경우
+            return False, None
+        if ttl is not None and time.time() - stat.st_mtime > ttl:
+            path.unlink(missing_ok=True)
+            self._count("expired")
+            return False, None
+        try:
+            value = FileManager.load_data(key, self.cache_dir)
+        except Exception as e:
+            logging.warning(f"캐시 항목 '{key}'를 읽지 못했습니다: {e}")
+            return False, None
+        try:
+            os.utime(path, (time.time(), stat.st_mtime))
+        except FileNotFoundError:
+            pass
+        return True, value
+
+    def get(self, key, ttl=None):
+        """
+        키에 해당하는 캐시 값을 반환하는 함수. 없으면 KeyError를 발생시킨다.
+        """
+        found, value = self._load(key, self.ttl if ttl is None else ttl)
+        if not found:
+            self._count("misses")
+            raise KeyError(key)
+        self._count("hits")
+        return value
+
+    def set(self, key, value):
+        """
+        값을 캐시에 저장하는 함수. 임시 파일에 쓴 뒤 이름을 바꾸므로 읽는 쪽은 항상 완전한 파일을 본다.
+        """
+        FileManager.save_data(value, key, self.cache_dir, backend=self.backend, compression=self.compression)
+        if self.max_bytes is not None:
+            self._evict()
+
+    def memoize(self, func=None, *, ttl=None, ignore=()):
+        """
+        함수 결과를 캐시하는 데코레이터. @cache.memoize 또는 @cache.memoize(ttl=60) 형태로 사용한다.
+        ttl이 None이면 캐시의 기본 ttl을 따른다.
+        ignore에는 키에서 뺄 인자 이름이나 위치를 준다 (예: 잠금이나 클라이언트를 가진 메서드의 "self").
+        """
+        if func is None:
+            return lambda f: self.memoize(f, ttl=ttl, ignore=ignore)
+        entry_ttl = self.ttl if ttl is None else ttl
+        signature = inspect.signature(func) if ignore else None
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if signature is not None:
+                key = self.make_key(func, *self._drop_ignored(signature, args, kwargs, ignore))
+            else:
+                key = self.make_key(func, args, kwargs)
+            found, value = self._load(key, entry_ttl)
+            if found:
+                self._count("hits")
+                return value
+            stripe = int(hashlib.sha1(key.encode("utf-8")).hexdigest(), 16) % self.LOCK_STRIPES
+            with self._lock(f"key-{stripe}"):
+                # 잠금을 기다리는 동안 다른 프로세스가 계산을 끝냈을 수 있다
+                found, value = self._load(key, entry_ttl)
+                if found:
+                    self._count("hits")
+                    return value
+                self._count("misses")
+                value = func(*args, **kwargs)
+                self.set(key, value)
+            return value
+
+        wrapper.cache = self
+        return wrapper
+
+    def _entries(self):
+        entries = []
+        extensions = {f".{extension}" for extension in FileManager.SERIALIZATION_BACKENDS.values()}
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.is_file() and not entry.name.startswith(".") and Path(entry.name).suffix in extensions:
+                    stat = entry.stat()
+                    entries.append((stat.st_atime, stat.st_size, entry.path))
+        return entries
+
+    def _evict(self):
+        with self._lock("evict"):
+            entries = self._entries()
+            total = sum(size for _, size, _ in entries)
+            if total <= self.max_bytes:
+                return
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                    self._count("evictions")
+                except FileNotFoundError:
+                    pass
+            logging.info(f"캐시 크기 제한으로 항목을 삭제했습니다. 현재 크기: {total / 1024 ** 2:.1f} MB")
+
+    def clear(self):
+        """
+        모든 캐시 항목을 삭제하는 함수.
+        """
+        with self._lock("evict"):
+            for _, _, path in self._entries():
+                os.remove(path)
+
+    def stats(self) -> dict:
+        """
+        이 프로세스의 적중/실패 횟수와 캐시 폴더의 현재 크기를 반환하는 함수.
+        """
+        entries = self._entries()
+        with self._stats_lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "expired": self.expired,
+                "evictions": self.evictions,
+                "entries": len(entries),
+                "bytes": sum(size for _, size, _ in entries),
+                "max_bytes": self.max_bytes,
+            }
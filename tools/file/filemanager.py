@@ -1,13 +1,28 @@
 import os
+import io
+import json
+import mmap
 import pickle
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from openpyxl import Workbook, load_workbook
 from openpyxl.utils.dataframe import dataframe_to_rows
 from datetime import datetime
+import numpy as np
 import pandas as pd
 import logging
-import pickle
 from pathlib import Path
 
+# 압축 형식별 파일 시작 바이트 (load 시 자동 판별에 사용)
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_LZ4_MAGIC = b"\x04\x22\x4d\x18"
+# pickle protocol 5 out-of-band 파일 형식의 시작 바이트
+_OOB_MAGIC = b"XKP5"
+_OOB_ALIGN = 64
+
 class FileManager:
     def __init__(self):
         logging.basicConfig(level=logging.INFO)
@@ -15,43 +30,324 @@ class FileManager:
 
     @staticmethod
     def make_dir(folder_path):
-        relative_path = folder_path.split("/")
-        current_path = os.getcwd()
-        for folder_name in relative_path:
-            current_path = os.path.join(current_path, folder_name)
-            if not os.path.exists(current_path):
-                os.makedirs(current_path)
-                logging.info(f"폴더 '{folder_name}'가 생성되었습니다.")
+        current_path = os.path.join(os.getcwd(), folder_path)
+        if not os.path.isdir(current_path):
+            # 중간 경로까지 한 번에 생성한다
+            os.makedirs(current_path, exist_ok=True)
+            logging.info(f"폴더 '{folder_path}'가 생성되었습니다.")
 
     @staticmethod
-    def delete_dir(folder_path):
-        try:
-            if os.path.exists(folder_path):
-                for root, dirs, files in os.walk(folder_path, topdown=False):
-                    for name in files:
-                        file_path = os.path.join(root, name)
-                        os.remove(file_path)
-                        logging.info(f"파일 '{file_path}'가 삭제되었습니다.")
-                    for name in dirs:
-                        dir_path = os.path.join(root, name)
-                        os.rmdir(dir_path)
-                        logging.info(f"디렉토리 '{dir_path}'가 삭제되었습니다.")
-                os.rmdir(folder_path)
-                logging.info(f"The folder at {folder_path} has been deleted.")
+    def _delete_tree(path):
+        """
+        scandir로 디렉토리를 순회하며 삭제하고 (파일 수, 디렉토리 수, 바이트 수)를 반환하는 함수.
+        """
+        files = dirs = nbytes = 0
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    sub_files, sub_dirs, sub_bytes = FileManager._delete_tree(entry.path)
+                    files += sub_files
+                    dirs += sub_dirs
+                    nbytes += sub_bytes
+                else:
+                    nbytes += entry.stat(follow_symlinks=False).st_size
+                    os.unlink(entry.path)
+                    files += 1
+        os.rmdir(path)
+        return files, dirs + 1, nbytes
+
+    @staticmethod
+    def _delete_tree_parallel(path, max_workers):
+        # 최상위 하위 디렉토리를 작업자들에게 나눠 삭제한다 (unlink는 GIL을 놓는다)
+        files = dirs = nbytes = 0
+        subdirs = []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                else:
+                    nbytes += entry.stat(follow_symlinks=False).st_size
+                    os.unlink(entry.path)
+                    files += 1
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for sub_files, sub_dirs, sub_bytes in executor.map(FileManager._delete_tree, subdirs):
+                files += sub_files
+                dirs += sub_dirs
+                nbytes += sub_bytes
+        os.rmdir(path)
+        return files, dirs + 1, nbytes
+
+    @staticmethod
+    def delete_dir(folder_path, max_workers=1, background=False):
+        """
+        폴더를 삭제하고 삭제한 파일/디렉토리 수와 크기를 한 줄로 기록하는 함수.
+
+        Args:
+            folder_path (str | Path): 삭제할 폴더
+            max_workers (int): 1보다 크면 최상위 하위 폴더들을 여러 스레드에서 동시에 삭제
+            background (bool): True이면 폴더 이름을 바꿔 즉시 비운 것처럼 만든 뒤,
+                               실제 삭제는 백그라운드 스레드에서 진행
+
+        Returns:
+            dict: files, dirs, bytes, elapsed. background이면 삭제 스레드(thread)를 담아 바로 반환
+        """
+        def run(path):
+            start = time.perf_counter()
+            if max_workers > 1:
+                files, dirs, nbytes = FileManager._delete_tree_parallel(path, max_workers)
             else:
+                files, dirs, nbytes = FileManager._delete_tree(path)
+            elapsed = time.perf_counter() - start
+            logging.info(f"The folder at {folder_path} has been deleted: {files} files, {dirs} directories, "
+                         f"{nbytes / 1024 ** 2:.1f} MB in {elapsed:.2f}s.")
+            return {"files": files, "dirs": dirs, "bytes": nbytes, "elapsed": elapsed}
+
+        try:
+            if not os.path.exists(folder_path):
                 logging.warning(f"The folder at {folder_path} does not exist.")
+                return None
+            if not background:
+                return run(folder_path)
+
+            # 같은 상위 폴더 안에서 이름만 바꾸므로 즉시 끝나며, 원래 경로는 바로 다시 사용할 수 있다
+            trash_path = f"{os.path.normpath(folder_path)}.deleting-{os.getpid()}-{time.time_ns()}"
+            os.rename(folder_path, trash_path)
+
+            def run_background():
+                try:
+                    run(trash_path)
+                except Exception as e:
+                    logging.error(f"Error: {e}")
+
+            thread = threading.Thread(target=run_background, name=f"delete_dir:{folder_path}")
+            thread.start()
+            logging.info(f"The folder at {folder_path} has been moved to {trash_path} for background deletion.")
+            return {"thread": thread, "trash_path": trash_path}
         except Exception as e:
             logging.error(f"Error: {e}")
 
     @staticmethod
     def load_from_pickle(storage_name, data_path: Path = Path.cwd()):
+        # zstd/lz4로 압축된 파일은 시작 바이트로 판별해 풀어서 읽는다
         with open(f"{data_path}/{storage_name}.pickle", 'rb') as f:
-            return pickle.load(f)
-        
+            with FileManager._decompressed(f) as stream:
+                return pickle.load(stream)
+
+    @staticmethod
+    def save_to_pickle(data, storage_name, data_path: Path = Path.cwd(), protocol=pickle.HIGHEST_PROTOCOL,
+                       compression=None):
+        """
+        compression: None, "zstd"(zstandard 패키지) 또는 "lz4"(lz4 패키지)
+        임시 파일에 쓴 뒤 이름을 바꾸므로 저장 도중 실패해도 기존 파일이 깨지지 않는다.
+        """
+        with FileManager._atomic_write(f"{data_path}/{storage_name}.pickle") as f:
+            with FileManager._compressed(f, compression) as stream:
+                pickle.dump(data, stream, protocol=protocol)
+
     @staticmethod
-    def save_to_pickle(data, storage_name, data_path: Path = Path.cwd()):
-        with open(f"{data_path}/{storage_name}.pickle", 'wb') as f:
-            pickle.dump(data, f)
+    @contextmanager
+    def _atomic_write(file_path):
+        file_path = Path(file_path)
+        fd, tmp_path = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                yield f
+            # mkstemp는 0600으로 만들므로, 기존 파일의 권한을 유지하거나 umask에 맞춘 일반 파일 권한을 준다
+            try:
+                mode = os.stat(file_path).st_mode & 0o7777
+            except FileNotFoundError:
+                umask = os.umask(0)
+                os.umask(umask)
+                mode = 0o666 & ~umask
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @staticmethod
+    @contextmanager
+    def _compressed(f, compression=None):
+        if compression is None:
+            yield f
+        elif compression == "zstd":
+            import zstandard
+            with zstandard.ZstdCompressor().stream_writer(f, closefd=False) as stream:
+                yield stream
+        elif compression == "lz4":
+            import lz4.frame
+            with lz4.frame.open(f, 'wb') as stream:
+                yield stream
+        else:
+            raise ValueError(f"지원하지 않는 압축 형식입니다: {compression}")
+
+    @staticmethod
+    @contextmanager
+    def _decompressed(f):
+        magic = f.read(4)
+        f.seek(0)
+        if magic == _ZSTD_MAGIC:
+            import zstandard
+            with zstandard.ZstdDecompressor().stream_reader(f, closefd=False) as stream:
+                yield io.BufferedReader(stream)
+        elif magic == _LZ4_MAGIC:
+            import lz4.frame
+            with lz4.frame.open(f, 'rb') as stream:
+                yield stream
+        else:
+            yield f
+
+    # backend별 파일 확장자
+    SERIALIZATION_BACKENDS = {"pickle": "pickle", "oob": "pkl5", "feather": "feather", "npy": "npy"}
+
+    @staticmethod
+    def save_data(data, storage_name, data_path: Path = Path.cwd(), backend="auto", compression=None):
+        """
+        데이터를 backend 형식으로 원자적으로 저장하는 함수.
+
+        backend:
+            "pickle"  - {storage_name}.pickle, save_to_pickle과 같음 (compression: "zstd"/"lz4")
+            "oob"     - {storage_name}.pkl5, pickle protocol 5 + out-of-band 버퍼. load_data(mmap_mode=True)이면 복사 없이 사용
+            "feather" - {storage_name}.feather, DataFrame 전용 Arrow 형식 (compression: "zstd"/"lz4"이면 mmap 불가)
+            "npy"     - {storage_name}.npy, numpy 배열 전용. load_data(mmap_mode=True)이면 mmap으로 읽음
+            "auto"    - DataFrame은 feather, ndarray는 npy, 그 외는 oob
+
+        Returns:
+            Path: 저장된 파일 경로
+        """
+        if backend == "auto":
+            if isinstance(data, pd.DataFrame):
+                backend = "feather"
+            elif isinstance(data, np.ndarray):
+                backend = "npy"
+            else:
+                backend = "oob"
+        if backend not in FileManager.SERIALIZATION_BACKENDS:
+            raise ValueError(f"지원하지 않는 backend입니다: {backend}")
+        file_path = Path(data_path) / f"{storage_name}.{FileManager.SERIALIZATION_BACKENDS[backend]}"
+
+        if backend == "pickle":
+            FileManager.save_to_pickle(data, storage_name, data_path, compression=compression)
+        elif backend == "oob":
+            FileManager._save_oob(data, file_path)
+        elif backend == "feather":
+            import pyarrow as pa
+            import pyarrow.feather as feather
+            table = pa.Table.from_pandas(data, preserve_index=True)
+            with FileManager._atomic_write(file_path) as f:
+                feather.write_feather(table, f, compression=compression or "uncompressed")
+        else:
+            with FileManager._atomic_write(file_path) as f:
+                np.save(f, data, allow_pickle=False)
+        logging.debug(f"'{file_path}'에 {backend} 형식으로 저장되었습니다.")
+        return file_path
+
+    @staticmethod
+    def load_data(storage_name, data_path: Path = Path.cwd(), backend=None, mmap_mode=False):
+        """
+        save_data로 저장한 데이터를 읽는 함수. backend가 None이면 존재하는 파일 확장자로 판단한다.
+        mmap_mode가 True이면 oob/npy 파일을 복사 없이 메모리 매핑으로 읽는다.
+        이때 oob/npy로 읽은 배열과 DataFrame은 읽기 전용이므로 값을 바꾸려면 먼저 copy()해야 한다.
+        feather는 파일을 메모리 매핑으로 읽지만 DataFrame으로 바꿀 때 값이 복사된다.
+        """
+        if backend is None:
+            for name, extension in FileManager.SERIALIZATION_BACKENDS.items():
+                if (Path(data_path) / f"{storage_name}.{extension}").exists():
+                    backend = name
+                    break
+            else:
+                raise FileNotFoundError(f"'{data_path}'에 '{storage_name}' 데이터가 없습니다.")
+        file_path = Path(data_path) / f"{storage_name}.{FileManager.SERIALIZATION_BACKENDS[backend]}"
+
+        if backend == "pickle":
+            return FileManager.load_from_pickle(storage_name, data_path)
+        if backend == "oob":
+            return FileManager._load_oob(file_path, mmap_mode)
+        if backend == "feather":
+            import pyarrow.feather as feather
+            return feather.read_table(file_path, memory_map=mmap_mode).to_pandas()
+        return np.load(file_path, mmap_mode='r' if mmap_mode else None, allow_pickle=False)
+
+    @staticmethod
+    def _save_oob(data, file_path):
+        buffers = []
+
+        def buffer_callback(buffer):
+            # 연속된 메모리 버퍼만 out-of-band로 분리하고, 나머지는 pickle 안에 둔다
+            try:
+                buffers.append(buffer.raw())
+                return False
+            except BufferError:
+                return True
+
+        payload = pickle.dumps(data, protocol=5, buffer_callback=buffer_callback)
+        header = json.dumps({"pickle": len(payload), "buffers": [b.nbytes for b in buffers]}).encode("utf-8")
+        with FileManager._atomic_write(file_path) as f:
+            f.write(_OOB_MAGIC + len(header).to_bytes(8, "little") + header)
+            f.write(payload)
+            for buffer in buffers:
+                f.write(b"\0" * (-f.tell() % _OOB_ALIGN))  # 버퍼 시작 위치를 정렬한다
+                f.write(buffer)
+
+    @staticmethod
+    def _load_oob(file_path, mmap_mode=False):
+        with open(file_path, 'rb') as f:
+            if mmap_mode:
+                data = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            else:
+                data = memoryview(bytearray(f.read()))
+        if bytes(data[:4]) != _OOB_MAGIC:
+            raise ValueError(f"'{file_path}'는 oob 형식이 아닙니다.")
+        header_length = int.from_bytes(data[4:12], "little")
+        header = json.loads(bytes(data[12:12 + header_length]))
+        position = 12 + header_length
+        payload = data[position:position + header["pickle"]]
+        position += header["pickle"]
+        buffers = []
+        for nbytes in header["buffers"]:
+            position += -position % _OOB_ALIGN
+            buffers.append(data[position:position + nbytes])
+            position += nbytes
+        return pickle.loads(payload, buffers=buffers)
+
+    @staticmethod
+    def benchmark_serialization(data, data_path: Path = None, backends=None, repeat=3) -> pd.DataFrame:
+        """
+        backend별 파일 크기, 저장/로드 시간을 비교하는 함수.
+        backends는 (backend, compression) 튜플 리스트이며, None이면 data에 맞는 조합을 모두 비교한다.
+        압축 패키지나 pyarrow가 없어 실패한 조합은 error 열에 기록된다.
+
+        Returns:
+            pd.DataFrame: backend, compression, size_bytes, save_sec, load_sec, error
+        """
+        if backends is None:
+            backends = [("pickle", None), ("pickle", "zstd"), ("pickle", "lz4"), ("oob", None)]
+            if isinstance(data, pd.DataFrame):
+                backends += [("feather", None), ("feather", "zstd"), ("feather", "lz4")]
+            elif isinstance(data, np.ndarray):
+                backends += [("npy", None)]
+
+        results = []
+        with tempfile.TemporaryDirectory(dir=data_path) as tmp_dir:
+            for backend, compression in backends:
+                name = f"bench_{backend}_{compression}"
+                row = {"backend": backend, "compression": compression, "size_bytes": None,
+                       "save_sec": None, "load_sec": None, "error": None}
+                try:
+                    start = time.perf_counter()
+                    for _ in range(repeat):
+                        file_path = FileManager.save_data(data, name, tmp_dir, backend=backend, compression=compression)
+                    row["save_sec"] = (time.perf_counter() - start) / repeat
+                    row["size_bytes"] = os.path.getsize(file_path)
+                    start = time.perf_counter()
+                    for _ in range(repeat):
+                        FileManager.load_data(name, tmp_dir, backend=backend)
+                    row["load_sec"] = (time.perf_counter() - start) / repeat
+                except Exception as e:
+                    row["error"] = str(e)
+                results.append(row)
+        return pd.DataFrame(results)
 
     @staticmethod
     def get_datetime_info(include_time=True):
@@ -67,12 +363,17 @@ class FileManager:
         return name
 
     @staticmethod
-    def dict_to_excel(dict_data, file_name="dictToExcel", sheet_name="sheet1", orient_idx=True):
+    def dict_to_excel(dict_data, file_name="dictToExcel", sheet_name="sheet1", orient_idx=True, streaming=False):
         orient = 'columns'
         if orient_idx: orient = 'index'
 
         df = pd.DataFrame.from_dict(dict_data, orient=orient).reset_index().rename(columns={'index': 'model'})
 
+        if streaming:
+            # 기존 파일 전체를 메모리에 올리지 않고 시트를 추가한다
+            FileManager.sheets_to_excel({sheet_name: df}, file_name=file_name, keep_existing=True)
+            return
+
         try:
             wb = load_workbook(filename=f"{file_name}.xlsx")
             ws = wb.create_sheet(title=sheet_name)
@@ -90,13 +391,184 @@ class FileManager:
         logging.info(f"데이터가 {file_name}.xlsx 파일의 {sheet_name} 시트에 저장되었습니다.")
 
     @staticmethod
-    def df_to_excel(df_data, file_name="dfToExcel", sheet_name="sheet1", mode='w'):
+    def df_to_excel(df_data, file_name="dfToExcel", sheet_name="sheet1", mode='w', streaming=False):
+        if streaming:
+            # df_data는 DataFrame 또는 DataFrame 조각을 내는 반복자
+            FileManager.sheets_to_excel({sheet_name: df_data}, file_name=file_name, keep_existing=(mode == 'a'))
+            return
         # Create Excel writer
         with pd.ExcelWriter(file_name, engine='openpyxl', mode=mode) as writer:
             # Write each DataFrame to a different sheet
             df_data.to_excel(writer, sheet_name=sheet_name, index=False)
             logging.info(f"DataFrame이 {file_name}.xlsx 파일의 {sheet_name} 시트에 저장되었습니다.")
 
+    @staticmethod
+    def read_table_chunks(file_name, chunk_size=10000, sheet_name=None, columns=None, dtype=None):
+        """
+        .xlsx 또는 .csv 파일을 chunk_size 행씩 DataFrame으로 나눠 읽는 제너레이터.
+        .xlsx는 읽기 전용 모드로 한 행씩 읽으므로 메모리 사용량이 chunk_size에 비례한다.
+        그 외 확장자(.csv, .csv.gz 등)는 pd.read_csv의 chunksize를 사용한다.
+
+        Args:
+            file_name (str | Path): 읽을 파일 경로
+            chunk_size (int): DataFrame 하나에 담을 행 수
+            sheet_name (str | int): 읽을 시트 이름 또는 순서. None이면 첫 번째 시트 (.xlsx 전용)
+            columns (list): 읽을 열 이름 목록. None이면 모든 열
+            dtype (dict | type): 열별 자료형. None이면 값이 있는 첫 조각에서 열별 자료형을 추론해 이후 조각에도 적용한다
+                (정수/불리언 열은 빈 값을 담을 수 있는 Int64/boolean).
+                이후 조각에 그 자료형으로 바꿀 수 없는 값이 있으면 해당 조각만 추론한 자료형을 쓰므로,
+                모든 조각의 자료형이 반드시 같아야 하면 dtype을 지정한다
+
+        Yields:
+            pd.DataFrame: 최대 chunk_size 행의 DataFrame
+        """
+        if not str(file_name).endswith((".xlsx", ".xlsm")):
+            yield from FileManager._stable_dtypes(
+                pd.read_csv(file_name, chunksize=chunk_size, usecols=columns, dtype=dtype), dtype)
+            return
+        yield from FileManager._stable_dtypes(
+            FileManager._read_excel_chunks(file_name, chunk_size, sheet_name, columns, dtype), dtype)
+
+    @staticmethod
+    def _stable_dtypes(chunks, dtype=None):
+        """
+        열마다 값이 처음 나온 조각의 자료형을 기억해 그 조각과 이후 조각에 같은 자료형을 적용하는 제너레이터.
+        dtype으로 자료형을 지정한 열은 그대로 둔다.
+        """
+        if dtype is not None and not isinstance(dtype, dict):
+            yield from chunks
+            return
+        fixed = set(dtype or {})
+        dtypes = {}
+        for df in chunks:
+            for column in df.columns:
+                if column in fixed:
+                    continue
+                if column not in dtypes:
+                    if not df[column].notna().any():
+                        continue
+                    inferred = df[column].dtype
+                    # 이후 조각에 빈 값이 있어도 같은 자료형을 유지하도록 정수/불리언은 nullable 자료형을 쓴다
+                    if pd.api.types.is_integer_dtype(inferred) and not pd.api.types.is_extension_array_dtype(inferred):
+                        inferred = pd.api.types.pandas_dtype(inferred.name.capitalize())
+                    elif pd.api.types.is_bool_dtype(inferred) and not pd.api.types.is_extension_array_dtype(inferred):
+                        inferred = pd.BooleanDtype()
+                    dtypes[column] = inferred
+                if df[column].dtype != dtypes[column]:
+                    try:
+                        df[column] = df[column].astype(dtypes[column])
+                    except (ValueError, TypeError):
+                        logging.warning(f"'{column}' 열을 {dtypes[column]}로 바꿀 수 없어 이 조각은 "
+                                        f"{df[column].dtype}로 반환합니다. dtype 인자로 자료형을 지정하세요.")
+            yield df
+
+    @staticmethod
+    def _read_excel_chunks(file_name, chunk_size, sheet_name, columns, dtype):
+        """
+        .xlsx 시트를 읽기 전용 모드로 한 행씩 읽어 chunk_size 행의 DataFrame으로 내보내는 제너레이터.
+        """
+
+        wb = load_workbook(filename=file_name, read_only=True, data_only=True)
+        try:
+            if sheet_name is None:
+                ws = wb.worksheets[0]
+            elif isinstance(sheet_name, int):
+                ws = wb.worksheets[sheet_name]
+            else:
+                ws = wb[sheet_name]
+            rows = ws.iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            header = [str(name) if name is not None else f"Unnamed: {i}" for i, name in enumerate(header)]
+            if columns is not None:
+                missing = [column for column in columns if column not in header]
+                if missing:
+                    raise ValueError(f"시트에 없는 열입니다: {missing}")
+                positions = [header.index(column) for column in columns]
+            else:
+                columns, positions = header, list(range(len(header)))
+
+            def to_frame(chunk):
+                df = pd.DataFrame.from_records(chunk, columns=columns)
+                return df.astype(dtype) if dtype is not None else df.infer_objects()
+
+            chunk = []
+            for row in rows:
+                # 마지막 열들이 비어 있으면 행 길이가 짧을 수 있다
+                chunk.append(tuple(row[i] if i < len(row) else None for i in positions))
+                if len(chunk) >= chunk_size:
+                    yield to_frame(chunk)
+                    chunk = []
+            if chunk:
+                yield to_frame(chunk)
+        finally:
+            wb.close()
+
+    @staticmethod
+    def _excel_rows(data, index=False):
+        """
+        DataFrame 또는 (DataFrame 조각 / 행) 반복자를 엑셀 행으로 하나씩 내보내는 제너레이터.
+        DataFrame은 첫 조각의 열 이름을 헤더로 쓰고, 행 반복자는 첫 행을 헤더로 본다.
+        """
+        if isinstance(data, pd.DataFrame):
+            data = [data]
+        header_written = False
+        for chunk in data:
+            if not isinstance(chunk, pd.DataFrame):
+                yield list(chunk)
+                continue
+            if index:
+                chunk = chunk.reset_index()
+            if not header_written:
+                yield [str(column) for column in chunk.columns]
+                header_written = True
+            # NaN은 빈 셀로 쓴다
+            values = chunk.astype(object).where(chunk.notna(), None)
+            yield from values.itertuples(index=False, name=None)
+
+    @staticmethod
+    def sheets_to_excel(sheets: dict, file_name="sheetsToExcel", index=False, keep_existing=False):
+        """
+        여러 시트를 write-only 모드로 한 번에 저장하는 함수. 행을 하나씩 디스크로 내보내므로
+        메모리 사용량이 데이터 크기와 무관하다.
+
+        Args:
+            sheets (dict): {시트 이름: DataFrame 또는 DataFrame 조각/행 리스트를 내는 반복자}
+            file_name (str): 파일 이름 (.xlsx가 없으면 붙인다)
+            index (bool): True이면 DataFrame 인덱스도 저장
+            keep_existing (bool): True이면 기존 파일의 다른 시트를 읽기 전용 모드로 한 행씩 복사해 유지
+                                  (같은 이름의 시트는 새 데이터로 바뀐다)
+        """
+        file_path = file_name if str(file_name).endswith(".xlsx") else f"{file_name}.xlsx"
+        wb = Workbook(write_only=True)
+
+        existing = None
+        if keep_existing and os.path.exists(file_path):
+            existing = load_workbook(filename=file_path, read_only=True)
+            for ws_existing in existing.worksheets:
+                if ws_existing.title in sheets:
+                    continue
+                ws = wb.create_sheet(title=ws_existing.title)
+                for row in ws_existing.iter_rows(values_only=True):
+                    ws.append(row)
+                logging.info(f"기존 시트 '{ws_existing.title}'가 복사되었습니다.")
+
+        try:
+            for sheet_name, data in sheets.items():
+                ws = wb.create_sheet(title=sheet_name)
+                rows = 0
+                for row in FileManager._excel_rows(data, index=index):
+                    ws.append(row)
+                    rows += 1
+                logging.info(f"시트 '{sheet_name}'에 {rows}행이 저장되었습니다.")
+            with FileManager._atomic_write(file_path) as f:
+                wb.save(f)
+        finally:
+            if existing is not None:
+                existing.close()
+        logging.info(f"데이터가 {file_path} 파일에 저장되었습니다.")
+
 
 
    
\ No newline at end of file
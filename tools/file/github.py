@@ -1,13 +1,509 @@
 import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 import base64
-import pandas as pd
+import hashlib
 import json
+import logging
+import os
+import posixpath
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlsplit
+import pandas as pd
+
+
+class GitHubSession:
+    """
+    GitHub API 요청을 위한 공유 세션.
+    - keep-alive 연결 풀을 재사용한다
+    - GET 응답을 ETag와 함께 저장하고 If-None-Match로 다시 요청한다 (304 응답은 요청 한도에서 차감되지 않는다)
+    - X-RateLimit-* 헤더를 호스트/리소스별로 기록하고, 남은 한도가 low_water 아래로 떨어지면
+      리셋 시각까지 남은 한도를 나눠 쓰도록 요청 간격을 늘린다 (0이면 리셋까지 기다린다)
+
+    # 예시
+    session = GitHubSession(token="ghp_...", cache_dir=".github_cache")
+    response = session.get("https://api.github.com/repos/owner/repo/contents/data")
+    session.stats()
+    """
+
+    def __init__(self, token=None, cache_dir=None, pool_maxsize=10, max_retries=3, pace=True, low_water=10):
+        """
+        Args:
+            token (str): GitHub 토큰. None이면 익명 요청
+            cache_dir (str | Path): ETag 응답을 저장할 폴더. None이면 메모리에만 저장
+            pool_maxsize (int): 호스트별 유지할 최대 연결 수
+            max_retries (int): 한도 초과(403/429) 응답을 받았을 때 기다렸다가 다시 시도할 횟수
+            pace (bool): True이면 남은 한도가 적을 때 요청 간격을 조절
+            low_water (int): 남은 한도가 이 값보다 적어지면 간격 조절을 시작한다
+        """
+        self.token = token
+        self.max_retries = max_retries
+        self.pace = pace
+        self.low_water = low_water
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Accept": "application/vnd.github.v3+json"})
+
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._cache = {}
+        self._lock = threading.Lock()
+        self._limits = {}  # (host, resource) -> {"remaining", "reset", "limit"}
+        self._next_request_at = {}  # (host, resource) -> 다음 요청을 보낼 수 있는 시각
+        self.requests = 0
+        self.not_modified = 0
+        self.waited = 0.0
+
+    def _headers(self, headers=None, token=None):
+        merged = dict(headers or {})
+        token = token or self.token
+        if token and "Authorization" not in merged:
+            merged["Authorization"] = f"token {token}"
+        return merged
+
+    def _cache_key(self, url, params, headers):
+        # 같은 URL이라도 토큰이 다르면 응답이 다를 수 있으므로 인증 정보도 키에 넣는다
+        auth = headers.get("Authorization", "")
+        raw = json.dumps([url, sorted((params or {}).items()), hashlib.sha1(auth.encode("utf-8")).hexdigest()])
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def _load_cached(self, key):
+        entry = self._cache.get(key)
+        if entry is None and self.cache_dir is not None:
+            meta_path = self.cache_dir / f"{key}.json"
+            body_path = self.cache_dir / f"{key}.body"
+            try:
+                with open(meta_path, "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+                entry["content"] = body_path.read_bytes()
+                self._cache[key] = entry
+            except (FileNotFoundError, ValueError):
+                entry = None
+        return entry
+
+    def _store_cached(self, key, response):
+        entry = {
+            "etag": response.headers["ETag"],
+            "url": response.url,
+            "headers": {name: value for name, value in response.headers.items()
+                        if name.lower() in ("content-type", "etag", "last-modified", "link")},
+            "encoding": response.encoding,
+            "content": response.content,
+        }
+        self._cache[key] = entry
+        if self.cache_dir is not None:
+            (self.cache_dir / f"{key}.body").write_bytes(response.content)
+            meta = {k: v for k, v in entry.items() if k != "content"}
+            with open(self.cache_dir / f"{key}.json", "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+
+    @staticmethod
+    def _cached_response(entry, response):
+        cached = requests.Response()
+        cached.status_code = 200
+        cached._content = entry["content"]
+        cached.headers = CaseInsensitiveDict(entry["headers"])
+        cached.encoding = entry["encoding"]
+        cached.url = entry["url"]
+        cached.request = response.request
+        cached.from_cache = True
+        return cached
+
+    @staticmethod
+    def _limit_key(url):
+        parts = urlsplit(url)
+        # 검색 API는 별도의 한도를 쓴다
+        resource = "search" if "/search/" in parts.path else "core"
+        return parts.netloc, resource
+
+    def _wait_for_slot(self, key):
+        """
+        한도 헤더를 보낸 적이 있는 호스트/리소스에 대해서만, 남은 한도가 적을 때 기다린다.
+        """
+        with self._lock:
+            limits = self._limits.get(key)
+            if limits is None:
+                return
+            now = time.monotonic()
+            interval = self._interval(limits)
+            if interval <= 0:
+                return
+            wait = max(0.0, self._next_request_at.get(key, 0.0) - now)
+            # 다음 요청 시각을 미리 잡아 두어 여러 스레드가 같은 간격을 지키도록 한다
+            self._next_request_at[key] = max(now, self._next_request_at.get(key, 0.0)) + interval
+            if limits["remaining"] > 0:
+                limits["remaining"] -= 1  # 응답을 받기 전에 다른 스레드가 같은 한도를 중복해서 쓰지 않도록 한다
+            self.waited += wait
+        if wait > 0:
+            logging.debug(f"Pacing GitHub request to {key[0]} for {wait:.1f}s ({limits['remaining']} left).")
+            time.sleep(wait)
+
+    def _interval(self, limits):
+        """
+        남은 한도가 low_water 이상이면 0, 적으면 리셋 시각까지 남은 한도를 고르게 나눈 요청 간격(초)을 반환한다.
+        """
+        seconds_to_reset = max(0.0, limits["reset"] - time.time())
+        if limits["remaining"] >= self.low_water or seconds_to_reset == 0:
+            return 0.0
+        if limits["remaining"] <= 0:
+            return seconds_to_reset
+        return seconds_to_reset / limits["remaining"]
+
+    def _update_limits(self, response):
+        headers = response.headers
+        if "X-RateLimit-Remaining" not in headers:
+            return
+        host = urlsplit(response.url).netloc
+        resource = headers.get("X-RateLimit-Resource", "core")
+        try:
+            limits = {
+                "remaining": int(headers["X-RateLimit-Remaining"]),
+                "reset": float(headers.get("X-RateLimit-Reset", time.time())),
+                "limit": int(headers.get("X-RateLimit-Limit", 0)),
+            }
+        except ValueError:
+            return
+        with self._lock:
+            self._limits[(host, resource)] = limits
+
+    def _retry_after(self, response):
+        """
+        한도 초과 응답이면 기다릴 시간(초)을, 아니면 None을 반환한다.
+        """
+        if response.status_code not in (403, 429):
+            return None
+        if "Retry-After" in response.headers:
+            return float(response.headers["Retry-After"])
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            return max(0.0, float(response.headers.get("X-RateLimit-Reset", time.time())) - time.time()) + 1
+        return None
+
+    def request(self, method, url, headers=None, params=None, token=None, use_cache=True, pace=None, **kwargs):
+        """
+        GitHub API 요청을 보내는 함수. GET 요청은 ETag 캐시를 사용한다.
+        If-None-Match 재검증 요청은 304이면 한도를 쓰지 않으므로 간격 조절을 하지 않는다.
+        pace=False이면 이 요청만 간격 조절을 하지 않는다 (None이면 세션 설정을 따른다).
+
+        Returns:
+            requests.Response: 304 응답이면 저장된 본문으로 만든 200 응답 (response.from_cache == True)
+        """
+        headers = self._headers(headers, token)
+        cache_key = None
+        entry = None
+        if method.upper() == "GET" and use_cache:
+            cache_key = self._cache_key(url, params, headers)
+            with self._lock:
+                entry = self._load_cached(cache_key)
+            if entry is not None:
+                headers["If-None-Match"] = entry["etag"]
+
+        pace = self.pace if pace is None else pace
+        limit_key = self._limit_key(url)
+        body = kwargs.pop("data", None)
+        for attempt in range(self.max_retries + 1):
+            if pace and "If-None-Match" not in headers:
+                self._wait_for_slot(limit_key)
+            # 스트리밍 본문은 한 번만 읽을 수 있으므로 호출 가능한 객체를 받아 시도할 때마다 새로 만든다
+            data = body() if callable(body) else body
+            response = self.session.request(method, url, headers=headers, params=params, data=data, **kwargs)
+            with self._lock:
+                self.requests += 1
+            self._update_limits(response)
+            wait = self._retry_after(response)
+            if wait is None or attempt == self.max_retries:
+                break
+            logging.warning(f"GitHub rate limit reached. Waiting {wait:.0f}s before retrying {url}.")
+            with self._lock:
+                self.waited += wait
+            time.sleep(wait)
+
+        if response.status_code == 304 and entry is not None:
+            with self._lock:
+                self.not_modified += 1
+            return self._cached_response(entry, response)
+        if cache_key is not None and response.status_code == 200 and "ETag" in response.headers:
+            with self._lock:
+                self._store_cached(cache_key, response)
+        response.from_cache = False
+        return response
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request("PUT", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def patch(self, url, **kwargs):
+        return self.request("PATCH", url, **kwargs)
+
+    def stats(self) -> dict:
+        """
+        보낸 요청 수, 304(캐시 사용) 수, 한도 대기 시간, 리소스별 남은 한도를 반환하는 함수.
+        """
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "not_modified": self.not_modified,
+                "waited_sec": self.waited,
+                "rate_limits": {f"{host}/{resource}": dict(limits)
+                                for (host, resource), limits in self._limits.items()},
+            }
+
 
 class GitMgt:
-    
+    # 로컬 테스트 서버를 쓸 때는 이 주소들을 바꾼다
+    API_URL = "https://api.github.com"
+    RAW_URL = "https://raw.githubusercontent.com"
+    _session = None
+    _session_lock = threading.Lock()
+
     def __init__(self):
         pass
     
+    @staticmethod
+    def get_session() -> GitHubSession:
+        """
+        모든 GitMgt 메서드가 함께 쓰는 GitHubSession을 반환하는 함수.
+        """
+        with GitMgt._session_lock:
+            if GitMgt._session is None:
+                GitMgt._session = GitHubSession()
+            return GitMgt._session
+
+    @staticmethod
+    def configure_session(**kwargs) -> GitHubSession:
+        """
+        공유 세션을 새 설정(GitHubSession 인자)으로 바꾸는 함수. 예: GitMgt.configure_session(cache_dir=".github_cache")
+        """
+        with GitMgt._session_lock:
+            GitMgt._session = GitHubSession(**kwargs)
+            return GitMgt._session
+
+    @staticmethod
+    def _api(method, path, git_token=None, expected=(200,), **kwargs):
+        """
+        GitHub API를 호출하고 JSON 응답을 반환하는 함수. 기대한 상태 코드가 아니면 requests.HTTPError를 발생시킨다.
+        """
+        response = GitMgt.get_session().request(method, f"{GitMgt.API_URL}{path}", token=git_token, **kwargs)
+        if response.status_code not in expected:
+            try:
+                message = response.json().get("message")
+            except ValueError:
+                message = response.text
+            raise requests.HTTPError(f"{method} {path} failed with {response.status_code}: {message}",
+                                     response=response)
+        return response.json()
+
+    # DataFrame을 JSON lines로 쓸 때 한 번에 변환할 행 수
+    JSON_LINES_CHUNK_ROWS = 10000
+
+    @staticmethod
+    def _write_content(content, file_path):
+        """
+        content를 file_path에 쓰는 함수. DataFrame은 JSON lines로 나눠 써서 전체 문자열을 메모리에 만들지 않는다.
+        """
+        with open(file_path, "wb") as f:
+            if isinstance(content, pd.DataFrame):
+                for start in range(0, len(content), GitMgt.JSON_LINES_CHUNK_ROWS):
+                    chunk = content.iloc[start:start + GitMgt.JSON_LINES_CHUNK_ROWS]
+                    text = chunk.to_json(orient='records', lines=True)
+                    if not text.endswith("\n"):  # 이전 pandas 버전은 마지막 줄바꿈이 없다
+                        text += "\n"
+                    f.write(text.encode('utf-8'))
+            elif isinstance(content, dict):
+                f.write(json.dumps(content).encode('utf-8'))
+            elif isinstance(content, str):
+                f.write(content.encode('utf-8'))
+            elif isinstance(content, bytes):
+                f.write(content)
+            else:
+                raise ValueError("content는 DataFrame, dict, str, bytes 이어야 합니다.")
+
+    @staticmethod
+    def _git_blob_sha(file_path) -> str:
+        """
+        GitHub가 계산하는 것과 같은 git blob SHA-1을 파일을 나눠 읽으며 계산하는 함수.
+        """
+        digest = hashlib.sha1(f"blob {os.path.getsize(file_path)}\0".encode("ascii"))
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _blob_body(file_path):
+        """
+        {"encoding": "base64", "content": ...} 요청 본문을 파일에서 조금씩 base64로 변환하며 내보내는 제너레이터.
+        """
+        yield b'{"encoding": "base64", "content": "'
+        with open(file_path, "rb") as f:
+            # 3의 배수 단위로 읽어야 조각별 base64를 이어 붙여도 올바른 결과가 된다
+            for block in iter(lambda: f.read(3 * 256 * 1024), b""):
+                yield base64.b64encode(block)
+        yield b'"}'
+
+    @staticmethod
+    def _create_blob(file_path, git_token, git_repo) -> str:
+        data = GitMgt._api("POST", f"/repos/{git_repo}/git/blobs", git_token, expected=(201,),
+                           data=lambda: GitMgt._blob_body(file_path),
+                           headers={"Content-Type": "application/json"})
+        return data["sha"]
+
+    @staticmethod
+    def _put_contents(path, content, git_token, git_repo, message) -> str:
+        """
+        Contents API로 파일 하나를 올리고 커밋 SHA를 반환하는 함수. 빈 저장소에 첫 커밋을 만들 때 사용한다.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            local_path = os.path.join(temp_dir, "content")
+            GitMgt._write_content(content, local_path)
+            with open(local_path, "rb") as f:
+                encoded_content = base64.b64encode(f.read()).decode('utf-8')
+        data = GitMgt._api("PUT", f"/repos/{git_repo}/contents/{path}", git_token, expected=(201,),
+                           json={"message": message, "content": encoded_content})
+        return data["commit"]["sha"]
+
+    # 상위 폴더가 이보다 많으면 폴더별로 조회하지 않고 전체 tree를 한 번에 조회한다
+    MAX_TREE_LOOKUPS = 10
+
+    @staticmethod
+    def _existing_blobs(git_repo, git_token, commit_sha, paths) -> dict:
+        """
+        paths의 상위 폴더만 조회해 이미 있는 파일의 (blob SHA, mode)를 반환하는 함수.
+
+        Returns:
+            dict: {저장소 내 경로: (blob SHA, mode)}
+        """
+        folders = sorted({posixpath.dirname(path) for path in paths})
+        if len(folders) > GitMgt.MAX_TREE_LOOKUPS:
+            lookups = [("", {"recursive": "1"})]
+        else:
+            lookups = [(folder, None) for folder in folders]
+
+        existing = {}
+        for folder, params in lookups:
+            tree_ref = f"{commit_sha}:{folder}" if folder else commit_sha
+            response = GitMgt.get_session().get(f"{GitMgt.API_URL}/repos/{git_repo}/git/trees/{tree_ref}",
+                                                token=git_token, params=params)
+            if response.status_code == 404:  # 아직 없는 폴더
+                continue
+            if response.status_code != 200:
+                raise requests.HTTPError(f"Tree lookup for '{folder}' failed with {response.status_code}.",
+                                         response=response)
+            tree = response.json()
+            if tree.get("truncated"):
+                logging.warning("Tree listing is truncated. Unchanged files outside the listing will be re-uploaded.")
+            prefix = f"{folder}/" if folder else ""
+            for item in tree["tree"]:
+                if item["type"] == "blob":
+                    existing[f"{prefix}{item['path']}"] = (item["sha"], item["mode"])
+        return existing
+
+    @staticmethod
+    def publish_files(files: dict, git_token, git_repo, branch=None, message="Upload files", batch_size=100,
+                      max_workers=8) -> dict:
+        """
+        여러 파일을 Git Data API로 배치당 하나의 커밋으로 올리는 함수.
+        blob은 병렬로 만들고, 배치마다 tree 하나와 commit 하나를 만든 뒤 브랜치 ref를 옮긴다.
+        저장소에 같은 내용(git blob SHA)이 이미 있는 파일은 올리지 않는다. 기존 파일은 올릴 파일의 상위 폴더만 조회해 찾는다.
+        빈 저장소이면 첫 파일은 Contents API로 올려 첫 커밋을 만든다.
+
+        Args:
+            files (dict): {저장소 내 경로: 내용}. 내용은 DataFrame(JSON lines), dict(JSON), str, bytes
+            git_token (str): GitHub 토큰
+            git_repo (str): "owner/repo"
+            branch (str): 올릴 브랜치. None이면 저장소의 기본 브랜치
+            message (str): 커밋 메시지. 배치가 여러 개이면 뒤에 (1/3) 형태로 번호를 붙인다
+            batch_size (int): 한 커밋에 담을 최대 파일 수
+            max_workers (int): blob을 동시에 만들 스레드 수
+
+        Returns:
+            dict: {"commits": 커밋 SHA 리스트, "uploaded": 올린 경로 리스트, "unchanged": 건너뛴 경로 리스트}
+        """
+        if branch is None:
+            branch = GitMgt._api("GET", f"/repos/{git_repo}", git_token)["default_branch"]
+        report = {"commits": [], "uploaded": [], "unchanged": []}
+        paths = list(files)
+        if not paths:
+            return report
+
+        ref_url = f"{GitMgt.API_URL}/repos/{git_repo}/git/ref/heads/{branch}"
+        response = GitMgt.get_session().get(ref_url, token=git_token, use_cache=False)
+        if response.status_code == 409:
+            # 빈 저장소에서는 Git Data API를 쓸 수 없으므로 첫 파일을 Contents API로 올려 첫 커밋을 만든다
+            first = paths.pop(0)
+            report["commits"].append(GitMgt._put_contents(first, files[first], git_token, git_repo, message))
+            report["uploaded"].append(first)
+            if not paths:
+                return report
+            response = GitMgt.get_session().get(ref_url, token=git_token, use_cache=False)
+        if response.status_code != 200:
+            raise requests.HTTPError(f"Branch '{branch}' not found in {git_repo} ({response.status_code}).",
+                                     response=response)
+        parent_sha = response.json()["object"]["sha"]
+        base_tree = GitMgt._api("GET", f"/repos/{git_repo}/git/commits/{parent_sha}", git_token)["tree"]["sha"]
+        existing = GitMgt._existing_blobs(git_repo, git_token, parent_sha, paths)
+
+        batches = [paths[i:i + batch_size] for i in range(0, len(paths), batch_size)]
+        with tempfile.TemporaryDirectory() as temp_dir, ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for batch_index, batch in enumerate(batches, start=1):
+                local_files = {}
+                entries = []
+                for i, path in enumerate(batch):
+                    local_path = os.path.join(temp_dir, str(i))
+                    GitMgt._write_content(files[path], local_path)
+                    blob_sha = GitMgt._git_blob_sha(local_path)
+                    if path in existing and existing[path][0] == blob_sha:
+                        report["unchanged"].append(path)
+                        os.remove(local_path)
+                        continue
+                    local_files[path] = local_path
+                    entries.append({"path": path, "mode": existing.get(path, (None, "100644"))[1],
+                                    "type": "blob", "sha": blob_sha})
+
+                if not entries:
+                    logging.info(f"Batch {batch_index}/{len(batches)}: all {len(batch)} files unchanged.")
+                    continue
+
+                futures = {path: executor.submit(GitMgt._create_blob, local_path, git_token, git_repo)
+                           for path, local_path in local_files.items()}
+                local_shas = {entry["path"]: entry["sha"] for entry in entries}
+                for path, future in futures.items():
+                    # GitHub가 돌려준 SHA가 로컬에서 계산한 SHA와 같아야 tree가 올바른 blob을 가리킨다
+                    if future.result() != local_shas[path]:
+                        raise RuntimeError(f"Blob SHA mismatch for {path}.")
+                    os.remove(local_files[path])
+
+                new_tree = GitMgt._api("POST", f"/repos/{git_repo}/git/trees", git_token, expected=(201,),
+                                       json={"base_tree": base_tree, "tree": entries})["sha"]
+                commit_message = message if len(batches) == 1 else f"{message} ({batch_index}/{len(batches)})"
+                commit_sha = GitMgt._api("POST", f"/repos/{git_repo}/git/commits", git_token, expected=(201,),
+                                         json={"message": commit_message, "tree": new_tree,
+                                               "parents": [parent_sha]})["sha"]
+                # 배치마다 ref를 옮겨 두면 중간에 실패해도 앞선 배치는 반영된 상태로 남는다
+                GitMgt._api("PATCH", f"/repos/{git_repo}/git/refs/heads/{branch}", git_token,
+                            json={"sha": commit_sha, "force": False})
+                parent_sha, base_tree = commit_sha, new_tree
+                for entry in entries:
+                    existing[entry["path"]] = (entry["sha"], entry["mode"])
+                report["commits"].append(commit_sha)
+                report["uploaded"].extend(entry["path"] for entry in entries)
+                logging.info(f"Batch {batch_index}/{len(batches)}: committed {len(entries)} files ({commit_sha[:7]}).")
+
+        logging.info(f"Published {len(report['uploaded'])} files in {len(report['commits'])} commits, "
+                     f"{len(report['unchanged'])} unchanged.")
+        return report
+
     @staticmethod    
     def upload_json_to_github(content, git_token, git_repo, file_name='data'):
         
@@ -20,34 +516,159 @@ class GitMgt:
         
         encoded_content = base64.b64encode(json_content.encode('utf-8')).decode('utf-8')
         
-        url = f'https://api.github.com/repos/{git_repo}/contents/{file_name}.json'
-        
-        headers = {
-            'Authorization': f'token {git_token}',
-            'Accept': 'application/vnd.github.v3+json'
-        }
+        url = f'{GitMgt.API_URL}/repos/{git_repo}/contents/{file_name}.json'
         
         data = {
             'message': 'Upload JSON file',
             'content': encoded_content, 
         }
 
-        response = requests.put(url, headers=headers, json=data)
+        # 이미 있는 파일은 sha를 함께 보내야 덮어쓸 수 있다
+        existing = GitMgt.get_session().get(url, token=git_token)
+        if existing.status_code == 200:
+            data['sha'] = existing.json()['sha']
+            raw = json_content.encode('utf-8')
+            if hashlib.sha1(f"blob {len(raw)}\0".encode('ascii') + raw).hexdigest() == data['sha']:
+                print('변경된 내용이 없어 업로드하지 않았습니다.')
+                return
 
-        if response.status_code == 201:
+        response = GitMgt.get_session().put(url, token=git_token, json=data)
+
+        if response.status_code in (200, 201):
             print('파일이 성공적으로 업로드되었습니다!')
         else:
             print('업로드 실패:', response.json())
             
+    @staticmethod
+    def list_tree(owner, repo, path="", branch="main", git_token=None) -> list:
+        """
+        path 아래의 모든 파일을 trees API 요청 한 번으로 재귀 조회하는 함수.
+
+        Returns:
+            list: [{"path": 저장소 내 경로, "sha": blob SHA, "size": 바이트 수}, ...]
+        """
+        path = path.strip("/")
+        tree_ref = f"{branch}:{path}" if path else branch
+        tree = GitMgt._api("GET", f"/repos/{owner}/{repo}/git/trees/{tree_ref}", git_token,
+                           params={"recursive": "1"})
+        if tree.get("truncated"):
+            logging.warning(f"Tree listing for {owner}/{repo}/{path} is truncated by GitHub.")
+        prefix = f"{path}/" if path else ""
+        return [{"path": f"{prefix}{item['path']}", "sha": item["sha"], "size": item.get("size")}
+                for item in tree["tree"] if item["type"] == "blob"]
+
+    @staticmethod
+    def _mirror_path(mirror_dir, sha) -> Path:
+        return Path(mirror_dir) / "objects" / sha[:2] / sha[2:]
+
+    @staticmethod
+    def _download_blob(owner, repo, branch, item, mirror_dir, git_token=None) -> Path:
+        """
+        파일 하나를 내려받아 blob SHA 이름으로 미러에 저장하는 함수.
+        raw URL은 API 요청 한도를 쓰지 않으므로 먼저 시도하고, 그 사이 브랜치가 바뀌어 SHA가 다르면 blobs API로 받는다.
+        """
+        target = GitMgt._mirror_path(mirror_dir, item["sha"])
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # raw URL은 요청 한도를 쓰지 않으므로 간격 조절 없이 받고, blobs API 대체 요청만 한도에 맞춰 조절한다
+        sources = [
+            (f"{GitMgt.RAW_URL}/{owner}/{repo}/{branch}/{item['path']}", {}, False),
+            (f"{GitMgt.API_URL}/repos/{owner}/{repo}/git/blobs/{item['sha']}",
+             {"Accept": "application/vnd.github.raw"}, None),
+        ]
+        for url, headers, pace in sources:
+            temp_path = target.with_name(f"{target.name}.{threading.get_ident()}.tmp")
+            response = GitMgt.get_session().get(url, headers=headers, token=git_token, use_cache=False, stream=True,
+                                                pace=pace)
+            if response.status_code != 200:
+                response.close()
+                continue
+            with open(temp_path, "wb") as f:
+                for block in response.iter_content(1024 * 1024):
+                    f.write(block)
+            if GitMgt._git_blob_sha(temp_path) == item["sha"]:
+                os.replace(temp_path, target)
+                return target
+            os.remove(temp_path)
+        raise RuntimeError(f"Could not download {item['path']} ({item['sha']}).")
+
+    @staticmethod
+    def fetch_folder(owner, repo, path="", branch="main", mirror_dir=".github_mirror", git_token=None,
+                     max_workers=8, suffixes=None) -> dict:
+        """
+        path 아래의 모든 파일을 로컬 미러로 동시에 내려받는 함수.
+        미러는 blob SHA를 파일 이름으로 쓰므로 다시 실행하면 바뀐 파일만 내려받는다.
+
+        Args:
+            owner (str): 저장소 소유자
+            repo (str): 저장소 이름
+            path (str): 가져올 폴더 경로. 빈 문자열이면 저장소 전체
+            branch (str): 브랜치, 태그 또는 커밋 SHA
+            mirror_dir (str | Path): 미러 폴더
+            git_token (str): GitHub 토큰. 비공개 저장소이거나 요청 한도를 늘릴 때 사용
+            max_workers (int): 동시에 내려받을 파일 수
+            suffixes (tuple): (".json", ".csv")처럼 주면 해당 확장자 파일만 가져온다
+
+        Returns:
+            dict: {저장소 내 경로: 미러의 로컬 파일 경로(Path)}
+        """
+        items = GitMgt.list_tree(owner, repo, path, branch, git_token)
+        if suffixes is not None:
+            items = [item for item in items if item["path"].lower().endswith(tuple(suffixes))]
+
+        local_files = {}
+        missing = []
+        for item in items:
+            target = GitMgt._mirror_path(mirror_dir, item["sha"])
+            if target.exists():
+                local_files[item["path"]] = target
+            else:
+                missing.append(item)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {item["path"]: executor.submit(GitMgt._download_blob, owner, repo, branch, item, mirror_dir,
+                                                     git_token)
+                       for item in missing}
+            for file_path, future in futures.items():
+                local_files[file_path] = future.result()
+
+        logging.info(f"Fetched {owner}/{repo}/{path}: {len(missing)} downloaded, "
+                     f"{len(items) - len(missing)} reused from mirror.")
+        return local_files
+
+    @staticmethod
+    def _read_payload(file_path, file_name) -> pd.DataFrame:
+        if file_name.lower().endswith(".csv"):
+            return pd.read_csv(file_path)
+        with open(file_path, "r", encoding="utf-8") as f:
+            first = f.read(1024).lstrip()[:1]
+        # upload_json_to_github는 DataFrame을 JSON lines, dict를 JSON 객체 하나로 저장한다
+        if first == "[":
+            return pd.read_json(file_path, orient="records")
+        return pd.read_json(file_path, lines=True)
+
+    @staticmethod
+    def read_folder_dataframes(owner, repo, path="", branch="main", mirror_dir=".github_mirror", git_token=None,
+                               max_workers=8) -> dict:
+        """
+        path 아래의 JSON/CSV 파일을 내려받아 DataFrame으로 읽는 함수.
+
+        Returns:
+            dict: {저장소 내 경로: DataFrame}
+        """
+        local_files = GitMgt.fetch_folder(owner, repo, path, branch, mirror_dir, git_token, max_workers,
+                                          suffixes=(".json", ".jsonl", ".csv"))
+        return {file_path: GitMgt._read_payload(local_path, file_path)
+                for file_path, local_path in local_files.items()}
+
+    @staticmethod
     def get_github_folder_files(owner, repo, path, branch="main"):
-        url = f"https://api.github.com/repos/{owner}/{repo}/contents/{path}?ref={branch}"
-        headers = {"Accept": "application/vnd.github.v3+json"}
-        response = requests.get(url, headers=headers)
+        url = f"{GitMgt.API_URL}/repos/{owner}/{repo}/contents/{path}"
+        response = GitMgt.get_session().get(url, params={"ref": branch})
 
         if response.status_code == 200:
             files = response.json()
             # 각 파일에 접근할 수 있는 raw URL을 생성하여 반환
-            return [f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{file['path']}" for file in files if file['type'] == 'file']
+            return [f"{GitMgt.RAW_URL}/{owner}/{repo}/{branch}/{file['path']}" for file in files if file['type'] == 'file']
         else:
             print(f"Error {response.status_code}: {response.json().get('message')}")
             return []
@@ -55,9 +676,9 @@ class GitMgt:
     
     @staticmethod 
     def get_github_files_as_dict(owner, repo, path=""):
-        url = f"https://api.github.com/repos/{owner}/{repo}/contents/{path}"
+        url = f"{GitMgt.API_URL}/repos/{owner}/{repo}/contents/{path}"
         
-        response = requests.get(url)
+        response = GitMgt.get_session().get(url)
         
         # 요청이 성공적인지 확인
         if response.status_code == 200:
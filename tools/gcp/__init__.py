@@ -1,4 +1,6 @@
 from .firestoremanager import FirestoreManager
 from .docker_image_manager import DockerImageManager
 from .auth import GCP_AUTH
-from .storagemager import StorageManager
\ No newline at end of file
+from .storagemager import StorageManager
+from .firestorecache import FirestoreCache
+from .asyncfirestoremanager import AsyncFirestoreManager
@@ -0,0 +1,233 @@
+from google.cloud import firestore
+from google.oauth2 import service_account
+import asyncio
+import logging
+import time
+import pandas as pd
+
+
+class AsyncFirestoreManager:
+    """
+    FirestoreManager와 같은 기능을 asyncio에서 사용할 수 있도록 AsyncClient로 구현한 클래스.
+    *_many 메서드는 동시 요청 수를 제한하며 여러 요청을 한 이벤트 루프에서 겹쳐 보낸다.
+
+    # 예시
+    manager = AsyncFirestoreManager(max_concurrency=200)
+    exists = await manager.is_doc_key_exist_many(keys, collection_name="items")
+    """
+
+    def __init__(self, credentials_file=None, max_concurrency: int = 100):
+        if credentials_file is not None:
+            self.credentials = service_account.Credentials.from_service_account_file(credentials_file)
+            logging.info("Credentials loaded successfully.")
+            self.db = firestore.AsyncClient(credentials=self.credentials)
+        else:
+            self.db = firestore.AsyncClient()
+        self.max_concurrency = max_concurrency
+        logging.info("Async Firestore client initialized successfully.")
+
+    async def _gather(self, coros, max_concurrency: int = None) -> list:
+        """
+        코루틴들을 동시에 실행하되 동시 실행 수를 max_concurrency로 제한하는 함수.
+        coros가 제너레이터이면 작업자가 하나씩 꺼내 쓰므로, 실행 중인 코루틴만 만들어진다.
+        결과는 입력 순서대로 반환하며, 실패한 항목은 예외 객체로 반환한다.
+        """
+        items = enumerate(coros)
+        results = {}
+
+        async def worker():
+            # 한 이벤트 루프 안에서는 next()가 중간에 끊기지 않으므로 작업자들이 같은 반복자를 나눠 쓸 수 있다
+            for i, coro in items:
+                try:
+                    results[i] = await coro
+                except Exception as e:
+                    results[i] = e
+
+        await asyncio.gather(*(worker() for _ in range(max_concurrency or self.max_concurrency)))
+        return [results[i] for i in range(len(results))]
+
+    async def save_dataframe(self, dict_data: dict, collection_name=None, max_concurrency: int = None):
+        """
+        데이터프레임의 각 행을 {data_name}_doc_{index} 키로 동시에 저장하는 함수.
+
+        Returns:
+            list: 저장에 실패한 문서 키 리스트.
+        """
+        collection_name = collection_name if collection_name else "default_collection"
+        collection_doc = self.db.collection(collection_name)
+
+        doc_keys = []
+
+        def coros():
+            for data_name, dataframe in dict_data.items():
+                for index, record in zip(dataframe.index, dataframe.to_dict(orient='records')):
+                    doc_key = f'{data_name}_doc_{index}'
+                    doc_keys.append(doc_key)
+                    yield collection_doc.document(doc_key).set(record)
+
+        results = await self._gather(coros(), max_concurrency)
+        failed = [doc_key for doc_key, result in zip(doc_keys, results) if isinstance(result, Exception)]
+        if failed:
+            logging.error(f"Failed to save {len(failed)}/{len(doc_keys)} documents under collection {collection_name}.")
+        else:
+            logging.info(f"Data saved successfully under collection {collection_name}.")
+        return failed
+
+    async def read_data(self, collection_name: str) -> pd.DataFrame:
+        logging.info(f"Reading data from collection: {collection_name}.")
+        data = []
+        doc_ids = []  # 문서 키를 저장할 리스트
+        async for doc in self.db.collection(collection_name).stream():
+            data.append(doc.to_dict())
+            doc_ids.append(doc.id)
+
+        if data:
+            logging.debug(f"Successfully converted {len(data)} documents to DataFrame.")
+            return pd.DataFrame(data, index=doc_ids)
+        else:
+            logging.warning(f"No documents found in collection: {collection_name}.")
+            return pd.DataFrame()
+
+    async def save_db(self, doc_key: str, data_dict: dict = None, collection_name: str = "sample_collection"):
+        """
+        Firestore에 데이터를 저장하는 함수.
+
+        Args:
+            doc_key (str): 문서의 고유 키.
+            data_dict (dict): Firestore에 저장할 데이터. 기본값은 빈 딕셔너리.
+            collection_name (str): Firestore 컬렉션 이름 (기본값: "sample_collection").
+        """
+        if data_dict is None:
+            data_dict = {}
+
+        logging.debug(f"Saving document with key: {doc_key}")
+        try:
+            await self.db.collection(collection_name).document(doc_key).set(data_dict)
+            logging.debug("Document saved successfully.")
+        except Exception as e:
+            logging.error(f"Error saving document: {e}")
+
+    async def get_all_document_keys(self, collection_name: str = "sample_collection") -> list:
+        """
+        Firestore에서 특정 컬렉션의 모든 문서 키를 추출하는 함수. 필드 데이터는 받지 않는다.
+
+        Args:
+            collection_name (str): 컬렉션 이름 (기본값: "sample_collection").
+
+        Returns:
+            list: 문서 키들의 리스트.
+        """
+        logging.info(f"Fetching all document keys from collection '{collection_name}'")
+        try:
+            query = self.db.collection(collection_name).select(["__name__"])
+            doc_keys = [doc.id async for doc in query.stream()]
+            logging.info(f"Retrieved {len(doc_keys)} document keys successfully.")
+            return doc_keys
+        except Exception as e:
+            logging.error(f"Error fetching document keys: {e}")
+            return []
+
+    async def is_doc_key_exist(self, doc_key: str, collection_name: str = "sample_collection") -> bool:
+        """
+        Firestore에서 doc_key가 중복되는지 확인하는 함수.
+
+        Args:
+            doc_key (str): 확인할 문서의 고유 키.
+            collection_name (str): 확인할 컬렉션 이름 (기본값: "sample_collection").
+
+        Returns:
+            bool: 문서가 존재하면 True, 존재하지 않으면 False.
+        """
+        try:
+            doc = await self.db.collection(collection_name).document(doc_key).get(field_paths=[])
+            logging.debug(f"Document with key '{doc_key}' exists: {doc.exists}")
+            return doc.exists
+        except Exception as e:
+            logging.error(f"Error checking document existence: {e}")
+            return False
+
+    async def delete_document(self, doc_key: str, collection_name: str = "sample_collection"):
+        """
+        Firestore에서 특정 문서를 삭제하는 함수.
+
+        Args:
+            doc_key (str): 삭제할 문서의 고유 키.
+            collection_name (str): 컬렉션 이름 (기본값: "sample_collection").
+        """
+        try:
+            await self.db.collection(collection_name).document(doc_key).delete()
+            logging.debug(f"Document with key '{doc_key}' deleted successfully.")
+        except Exception as e:
+            logging.error(f"Error deleting document: {e}")
+
+    async def save_db_many(self, data: dict, collection_name: str = "sample_collection",
+                           max_concurrency: int = None):
+        """
+        {doc_key: data_dict} 형태의 여러 문서를 동시에 저장하는 함수.
+        """
+        logging.info(f"Saving {len(data)} documents to collection '{collection_name}'")
+        await self._gather((self.save_db(doc_key, data_dict, collection_name)
+                            for doc_key, data_dict in data.items()), max_concurrency)
+
+    async def is_doc_key_exist_many(self, doc_keys: list, collection_name: str = "sample_collection",
+                                    max_concurrency: int = None) -> dict:
+        """
+        여러 문서 키의 존재 여부를 동시에 확인하는 함수.
+
+        Returns:
+            dict: {doc_key: 존재 여부(bool)}.
+        """
+        doc_keys = list(dict.fromkeys(doc_keys))
+        logging.info(f"Checking existence of {len(doc_keys)} documents in collection '{collection_name}'")
+        results = await self._gather((self.is_doc_key_exist(doc_key, collection_name) for doc_key in doc_keys),
+                                     max_concurrency)
+        return dict(zip(doc_keys, results))
+
+    async def _iter_document_keys(self, collection_name: str, prefix: str = None):
+        """
+        필드 데이터 없이 문서 키만 조회하는 비동기 제너레이터. prefix가 있으면 그 접두어로 시작하는 키만 조회한다.
+        """
+        collection_doc = self.db.collection(collection_name)
+        query = collection_doc.select(["__name__"])
+        if prefix:
+            query = query.where(filter=firestore.FieldFilter("__name__", ">=", collection_doc.document(prefix)))
+            query = query.where(filter=firestore.FieldFilter("__name__", "<", collection_doc.document(prefix + "\uf8ff")))
+        async for doc in query.stream():
+            yield doc.id
+
+    async def delete_documents(self, collection_name: str = "sample_collection", prefix: str = None,
+                               doc_keys: list = None, max_concurrency: int = None) -> dict:
+        """
+        컬렉션 전체, 키 접두어 또는 키 리스트에 해당하는 문서를 동시에 삭제하는 함수.
+        인자 순서는 FirestoreManager.delete_documents와 같다.
+
+        Args:
+            collection_name (str): 컬렉션 이름 (기본값: "sample_collection").
+            prefix (str): 이 접두어로 시작하는 문서만 삭제한다. 예: "prices_doc_"
+            doc_keys (list): 삭제할 문서 키 리스트. None이면 컬렉션(또는 접두어)을 조회해 삭제한다.
+            max_concurrency (int): 동시에 보낼 삭제 요청 수.
+
+        Returns:
+            dict: deleted, failed 개수, elapsed(초), docs_per_sec, failed_keys.
+        """
+        if doc_keys is None:
+            doc_keys = [doc_key async for doc_key in self._iter_document_keys(collection_name, prefix)]
+        else:
+            doc_keys = [doc_key for doc_key in doc_keys if not prefix or doc_key.startswith(prefix)]
+
+        logging.info(f"Deleting {len(doc_keys)} documents from collection '{collection_name}' (prefix: {prefix}).")
+        collection_doc = self.db.collection(collection_name)
+        start = time.perf_counter()
+        results = await self._gather((collection_doc.document(doc_key).delete() for doc_key in doc_keys),
+                                     max_concurrency)
+        elapsed = time.perf_counter() - start
+        failed_keys = [doc_key for doc_key, result in zip(doc_keys, results) if isinstance(result, Exception)]
+        deleted = len(doc_keys) - len(failed_keys)
+        summary = {"deleted": deleted, "failed": len(failed_keys), "elapsed": elapsed,
+                   "docs_per_sec": deleted / elapsed if elapsed > 0 else 0.0, "failed_keys": failed_keys}
+        logging.info(f"Deleted {deleted} documents from '{collection_name}' in {elapsed:.2f}s "
+                     f"({summary['docs_per_sec']:.1f} docs/sec, {len(failed_keys)} failed).")
+        return summary
+
+    async def close(self):
+        self.db.close()
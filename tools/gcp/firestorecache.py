@@ -0,0 +1,224 @@
+from collections import OrderedDict
+from pathlib import Path
+import hashlib
+import logging
+import pickle
+import shutil
+import threading
+import time
+import pandas as pd
+
+
+class FirestoreCache:
+    """
+    FirestoreManager의 읽기 결과를 보관하는 캐시.
+    메모리 한도를 넘으면 가장 오래 사용하지 않은 항목부터 제거(LRU)하고,
+    disk_dir이 주어지면 제거된 항목을 디스크 계층으로 내린다.
+
+    # 예시
+    cache = FirestoreCache(max_bytes=256 * 1024 ** 2, default_ttl=600, ttl_by_collection={"prices": 60})
+    manager = FirestoreManager(cache=cache)
+    manager.read_data("prices")  # 네트워크
+    manager.read_data("prices")  # 캐시
+    print(cache.stats())
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 ** 2, default_ttl: float = 600,
+                 ttl_by_collection: dict = None, disk_dir=None):
+        """
+        Args:
+            max_bytes (int): 메모리 계층의 최대 크기(바이트, 추정치).
+            default_ttl (float): 기본 유효 시간(초). None이면 만료되지 않는다.
+            ttl_by_collection (dict): {collection_name: ttl} 컬렉션별 유효 시간.
+            disk_dir (str | Path): 디스크 계층 경로. None이면 메모리만 사용한다.
+        """
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.ttl_by_collection = dict(ttl_by_collection or {})
+        self.disk_dir = Path(disk_dir) if disk_dir is not None else None
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+        self._entries = OrderedDict()  # (collection, key) -> (expires_at, size, value)
+        self._size = 0
+        self._lock = threading.RLock()
+        # 무효화될 때마다 늘리는 세대 번호. 읽는 도중 무효화된 결과를 저장하지 않기 위해 쓴다
+        self._generations = {}  # collection_name -> int
+        self._epoch = 0  # clear()마다 증가
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _estimate_size(value) -> int:
+        if isinstance(value, pd.DataFrame):
+            return int(value.memory_usage(index=True, deep=True).sum())
+        try:
+            return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception:
+            return 0
+
+    @staticmethod
+    def _hash(value) -> str:
+        return hashlib.sha1(repr(value).encode("utf-8")).hexdigest()
+
+    def _disk_path(self, collection_name: str, key=None) -> Path:
+        folder = self.disk_dir / self._hash(collection_name)
+        return folder if key is None else folder / f"{self._hash(key)}.pickle"
+
+    def _expires_at(self, collection_name: str):
+        ttl = self.ttl_by_collection.get(collection_name, self.default_ttl)
+        return None if ttl is None else time.monotonic() + ttl
+
+    @staticmethod
+    def _copy(value):
+        # 호출자가 결과를 수정해도 캐시가 바뀌지 않도록 DataFrame과 컨테이너는 복사해 반환한다
+        return value.copy() if isinstance(value, (pd.DataFrame, list, dict, set)) else value
+
+    def get(self, collection_name: str, key, default=None):
+        """
+        캐시된 값을 반환하는 함수. 없거나 만료되었으면 default를 반환한다.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get((collection_name, key))
+            if entry is not None:
+                expires_at, size, value = entry
+                if expires_at is None or expires_at > now:
+                    self._entries.move_to_end((collection_name, key))
+                    self.hits += 1
+                    return self._copy(value)
+                self._remove((collection_name, key))
+
+            if self.disk_dir is not None:
+                path = self._disk_path(collection_name, key)
+                try:
+                    with open(path, "rb") as f:
+                        expires_at, value = pickle.load(f)
+                except (OSError, pickle.UnpicklingError, EOFError):
+                    expires_at, value = 0, None
+                if expires_at is None or expires_at > time.time():
+                    path.unlink(missing_ok=True)
+                    # 디스크 계층에는 벽시계 시간으로 저장하므로 남은 시간만큼만 메모리로 올린다
+                    remaining = None if expires_at is None else time.monotonic() + (expires_at - time.time())
+                    self._put((collection_name, key), value, remaining)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return self._copy(value)
+                path.unlink(missing_ok=True)
+
+            self.misses += 1
+            return default
+
+    def set(self, collection_name: str, key, value):
+        """
+        값을 캐시에 저장하는 함수.
+        """
+        with self._lock:
+            self._put((collection_name, key), self._copy(value), self._expires_at(collection_name))
+
+    def get_or_load(self, collection_name: str, key, loader):
+        """
+        캐시에 값이 있으면 반환하고, 없으면 loader()를 호출해 결과를 저장한 뒤 반환하는 함수.
+        loader()가 실행되는 동안 컬렉션이 무효화되었으면 결과를 반환만 하고 저장하지 않는다.
+        """
+        missing = object()
+        with self._lock:
+            generation = self._generation(collection_name)
+            value = self.get(collection_name, key, missing)
+        if value is missing:
+            value = loader()
+            with self._lock:
+                if self._generation(collection_name) == generation:
+                    self.set(collection_name, key, value)
+                else:
+                    logging.debug(f"Skipped caching stale result for collection {collection_name} (key: {key}).")
+        return value
+
+    def _generation(self, collection_name: str):
+        return self._epoch, self._generations.get(collection_name, 0)
+
+    def _put(self, entry_key, value, expires_at):
+        if entry_key in self._entries:
+            self._remove(entry_key)
+        size = self._estimate_size(value)
+        self._entries[entry_key] = (expires_at, size, value)
+        self._size += size
+        while self._size > self.max_bytes and len(self._entries) > 1:
+            old_key, (old_expires_at, _, old_value) = next(iter(self._entries.items()))
+            self._remove(old_key)
+            self.evictions += 1
+            self._spill(old_key, old_value, old_expires_at)
+
+    def _remove(self, entry_key):
+        _, size, _ = self._entries.pop(entry_key)
+        self._size -= size
+
+    def _spill(self, entry_key, value, expires_at):
+        if self.disk_dir is None:
+            return
+        if expires_at is not None:
+            if expires_at <= time.monotonic():
+                return
+            expires_at = time.time() + (expires_at - time.monotonic())
+        path = self._disk_path(*entry_key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump((expires_at, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_path.replace(path)
+        except Exception as e:
+            logging.warning(f"Failed to spill cache entry to disk: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    def invalidate(self, collection_name: str, key=None):
+        """
+        캐시 항목을 무효화하는 함수. key가 None이면 컬렉션 전체를 무효화한다.
+        """
+        with self._lock:
+            if key is None:
+                for entry_key in [k for k in self._entries if k[0] == collection_name]:
+                    self._remove(entry_key)
+                if self.disk_dir is not None:
+                    shutil.rmtree(self._disk_path(collection_name), ignore_errors=True)
+            else:
+                if (collection_name, key) in self._entries:
+                    self._remove((collection_name, key))
+                if self.disk_dir is not None:
+                    self._disk_path(collection_name, key).unlink(missing_ok=True)
+            self._generations[collection_name] = self._generations.get(collection_name, 0) + 1
+            self.invalidations += 1
+        logging.debug(f"Cache invalidated for collection {collection_name} (key: {key}).")
+
+    def clear(self):
+        """
+        메모리와 디스크 계층을 모두 비우는 함수.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self._epoch += 1
+            if self.disk_dir is not None:
+                for path in self.disk_dir.iterdir():
+                    shutil.rmtree(path, ignore_errors=True)
+
+    def stats(self) -> dict:
+        """
+        캐시 적중/실패 횟수와 현재 크기를 반환하는 함수.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "disk_hits": self.disk_hits,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+            }
@@ -1,33 +1,299 @@
 from google.cloud import firestore
 from google.oauth2 import service_account
+from concurrent.futures import ThreadPoolExecutor
+import datetime
+import hashlib
+import json
 import logging
+import math
+import os
+import time
 import pandas as pd
+from .firestorecache import FirestoreCache
 
 class FirestoreManager:
-    def __init__(self, credentials_file=None):
+    def __init__(self, credentials_file=None, cache: FirestoreCache = None):
         if credentials_file is not None:
             self.credentials = service_account.Credentials.from_service_account_file(credentials_file)
             logging.info("Credentials loaded successfully.")
             self.db = firestore.Client(credentials=self.credentials)
         else:
             self.db = firestore.Client()
+        self._key_snapshots = {}  # 컬렉션별 문서 키 스냅샷 (load_key_snapshot)
+        self.cache = cache  # 읽기 캐시 (FirestoreCache, 선택 사항)
         logging.info("Firestore client initialized successfully.")
         
     def save_dataframe(self, dict_data: dict, collection_name=None):
         collection_doc = self.db.collection(collection_name) if collection_name else self.db.collection("default_collection")
 
-        for data_name, dataframe in dict_data.items():
-            # 데이터프레임을 컬렉션의 문서로 저장
-            for index, row in dataframe.iterrows():
-                doc_key = f'{data_name}_doc_{index}'  # 문서 키 생성
-                doc_ref = collection_doc.document(doc_key)  # 컬렉션 문서 참조
-                doc_ref.set(row.to_dict())  # 데이터 저장
-                logging.debug(f"Document {doc_key} added successfully under {collection_name}.")
-        
+        written_keys = []
+        try:
+            for data_name, dataframe in dict_data.items():
+                # 데이터프레임을 컬렉션의 문서로 저장
+                for index, row in dataframe.iterrows():
+                    doc_key = f'{data_name}_doc_{index}'  # 문서 키 생성
+                    doc_ref = collection_doc.document(doc_key)  # 컬렉션 문서 참조
+                    doc_ref.set(row.to_dict())  # 데이터 저장
+                    written_keys.append(doc_key)
+                    logging.debug(f"Document {doc_key} added successfully under {collection_name}.")
+        finally:
+            self._on_write(collection_doc.id, added=written_keys)
+
         logging.info(f"Data saved successfully under collection {collection_name if collection_name else 'default_collection'}.")
 
+    # Firestore 배치 커밋 한 번에 허용되는 최대 쓰기 수
+    MAX_BATCH_SIZE = 500
+
+    @staticmethod
+    def _dataframe_to_docs(data_name: str, dataframe: pd.DataFrame) -> list:
+        """
+        데이터프레임을 (문서 키, 데이터) 리스트로 변환하는 함수.
+        iterrows 대신 to_dict(orient='records')로 한 번에 변환한다.
+        """
+        doc_keys = [f'{data_name}_doc_{index}' for index in dataframe.index]
+        records = dataframe.to_dict(orient='records')
+        return list(zip(doc_keys, records))
+
+    def _commit_batch(self, collection_doc, batch_no: int, docs: list, max_retries: int, backoff: float) -> dict:
+        """
+        문서 묶음을 하나의 WriteBatch로 커밋하고, 실패하면 지수 백오프로 재시도하는 함수.
+        데이터가 None인 문서는 삭제한다.
+        """
+        result = {"batch": batch_no, "size": len(docs), "first_key": docs[0][0], "last_key": docs[-1][0],
+                  "success": False, "attempts": 0, "error": None}
+        for attempt in range(max_retries + 1):
+            result["attempts"] = attempt + 1
+            try:
+                batch = self.db.batch()
+                for doc_key, data in docs:
+                    if data is None:
+                        batch.delete(collection_doc.document(doc_key))
+                    else:
+                        batch.set(collection_doc.document(doc_key), data)
+                batch.commit()
+                result["success"] = True
+                result["error"] = None
+                logging.debug(f"Batch {batch_no} ({len(docs)} documents) committed successfully.")
+                break
+            except Exception as e:
+                result["error"] = str(e)
+                logging.warning(f"Batch {batch_no} commit failed (attempt {attempt + 1}/{max_retries + 1}): {e}")
+                if attempt < max_retries:
+                    time.sleep(backoff * (2 ** attempt))
+        return result
+
+    def save_dataframe_bulk(self, dict_data: dict, collection_name=None, batch_size: int = 500,
+                            max_workers: int = 4, max_retries: int = 3, backoff: float = 1.0) -> list:
+        """
+        save_dataframe과 같은 키 규칙({data_name}_doc_{index})으로 데이터프레임을 저장하되,
+        행 단위 set() 대신 WriteBatch 묶음을 여러 스레드에서 동시에 커밋하는 함수.
+        FIRESTORE_EMULATOR_HOST 환경변수가 설정되어 있으면 에뮬레이터로 연결된다.
+
+        Args:
+            dict_data (dict): {data_name: DataFrame} 형태의 데이터.
+            collection_name (str): 저장할 컬렉션 이름 (기본값: "default_collection").
+            batch_size (int): 배치 하나에 담을 문서 수 (최대 500).
+            max_workers (int): 동시에 커밋할 배치 수.
+            max_retries (int): 배치 커밋 실패 시 재시도 횟수.
+            backoff (float): 재시도 대기 시간의 기준값(초). 시도마다 2배씩 늘어난다.
+
+        Returns:
+            list: 배치별 결과 딕셔너리 리스트
+                  (batch, size, first_key, last_key, success, attempts, error).
+        """
+        collection_name = collection_name if collection_name else "default_collection"
+        docs = []
+        for data_name, dataframe in dict_data.items():
+            docs.extend(self._dataframe_to_docs(data_name, dataframe))
+        report, _ = self._write_batches(collection_name, docs, batch_size, max_workers, max_retries, backoff)
+        return report
+
+    def _write_batches(self, collection_name: str, docs: list, batch_size: int = 500, max_workers: int = 4,
+                       max_retries: int = 3, backoff: float = 1.0) -> tuple:
+        """
+        (문서 키, 데이터) 리스트를 배치로 나눠 동시에 커밋하는 함수. 데이터가 None이면 삭제한다.
+
+        Returns:
+            tuple: (배치별 결과 리스트, 커밋에 성공한 문서 키 집합)
+        """
+        collection_doc = self.db.collection(collection_name)
+        batch_size = max(1, min(batch_size, self.MAX_BATCH_SIZE))
+        chunks = [docs[i:i + batch_size] for i in range(0, len(docs), batch_size)]
+
+        logging.info(f"Writing {len(docs)} documents in {len(chunks)} batches under collection {collection_name}.")
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = [executor.submit(self._commit_batch, collection_doc, batch_no, chunk, max_retries, backoff)
+                       for batch_no, chunk in enumerate(chunks)]
+            report = [future.result() for future in futures]
+        elapsed = time.perf_counter() - start
+
+        committed = [doc for chunk, result in zip(chunks, report) if result["success"] for doc in chunk]
+        self._on_write(collection_name,
+                       added=[doc_key for doc_key, data in committed if data is not None],
+                       removed=[doc_key for doc_key, data in committed if data is None])
+
+        failed = [r["batch"] for r in report if not r["success"]]
+        rows_per_sec = len(committed) / elapsed if elapsed > 0 else float(len(committed))
+        logging.info(f"Wrote {len(committed)}/{len(docs)} documents in {elapsed:.2f}s ({rows_per_sec:.1f} rows/sec).")
+        if failed:
+            logging.error(f"Failed batches under collection {collection_name}: {failed}")
+        return report, {doc_key for doc_key, _ in committed}
+
+
+    @staticmethod
+    def _row_hashes(dataframe: pd.DataFrame) -> list:
+        """
+        데이터프레임의 각 행을 벡터 연산으로 해시하는 함수. 열 이름이 바뀌어도 해시가 달라진다.
+        """
+        columns_sig = hashlib.sha1("\x1f".join(map(str, dataframe.columns)).encode("utf-8")).hexdigest()[:16]
+        try:
+            hashes = pd.util.hash_pandas_object(dataframe, index=False)
+        except TypeError:
+            # 리스트/딕셔너리처럼 해시할 수 없는 값이 있으면 문자열로 바꿔 해시한다
+            hashes = pd.util.hash_pandas_object(dataframe.astype(str), index=False)
+        return [f"{columns_sig}{int(h):016x}" for h in hashes.to_numpy()]
+
+    @staticmethod
+    def _comparable(value):
+        """
+        날짜/시간 값을 UTC 기준으로 맞춘다. Firestore는 시간대가 없는 값을 UTC로 저장하고
+        마이크로초 단위까지만 보관한 뒤, 시간대가 있는 DatetimeWithNanoseconds로 돌려준다.
+        """
+        if isinstance(value, datetime.datetime):
+            value = pd.Timestamp(value)
+            value = value.tz_localize("UTC") if value.tzinfo is None else value.tz_convert("UTC")
+            return value.floor("us")
+        return value
+
+    @staticmethod
+    def _records_equal(local: dict, remote: dict) -> bool:
+        if remote is None or local.keys() != remote.keys():
+            return False
+        for field, value in local.items():
+            other = remote[field]
+            value, other = FirestoreManager._comparable(value), FirestoreManager._comparable(other)
+            if isinstance(value, float) and isinstance(other, float) and math.isnan(value) and math.isnan(other):
+                continue
+            if value != other:
+                return False
+        return True
+
+    @staticmethod
+    def _load_manifest(manifest_path) -> dict:
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    @staticmethod
+    def _save_manifest(manifest: dict, manifest_path):
+        tmp_path = f"{manifest_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, manifest_path)
+
+    def sync_dataframe(self, dict_data: dict, collection_name=None, manifest_path=None, delete_missing: bool = False,
+                       dry_run: bool = False, batch_size: int = 500, max_workers: int = 4,
+                       max_retries: int = 3, backoff: float = 1.0) -> dict:
+        """
+        데이터프레임을 save_dataframe과 같은 키 규칙({data_name}_doc_{index})으로 저장하되,
+        새로 생기거나 바뀐 행만 쓰는 함수.
+        manifest_path가 주어지면 로컬 매니페스트(JSON)에 저장한 행 해시와 비교하고,
+        없으면 Firestore의 현재 문서와 직접 비교한다.
+
+        Args:
+            dict_data (dict): {data_name: DataFrame} 형태의 데이터.
+            collection_name (str): 저장할 컬렉션 이름 (기본값: "default_collection").
+            manifest_path (str | Path): 행 해시를 보관할 매니페스트 파일 경로.
+            delete_missing (bool): True이면 같은 data_name 접두어를 가진 문서 중
+                                   데이터프레임에 없는 문서를 삭제한다.
+            dry_run (bool): True이면 쓰지 않고 변경 요약만 반환한다.
+            batch_size, max_workers, max_retries, backoff: save_dataframe_bulk와 같다.
+
+        Returns:
+            dict: inserted/updated/deleted/unchanged 개수와 키 목록, failed_batches.
+        """
+        collection_name = collection_name if collection_name else "default_collection"
+        manifest = self._load_manifest(manifest_path) if manifest_path else None
+        known = manifest.get(collection_name, {}) if manifest is not None else None
+
+        inserted, updated, unchanged, deleted = [], [], [], []
+        writes = []
+        new_hashes = {}
+        for data_name, dataframe in dict_data.items():
+            docs = self._dataframe_to_docs(data_name, dataframe)
+            prefix = f"{data_name}_doc_"
+            if known is not None:
+                # 매니페스트 모드: 행 해시 비교
+                for (doc_key, record), row_hash in zip(docs, self._row_hashes(dataframe)):
+                    new_hashes[doc_key] = row_hash
+                    previous = known.get(doc_key)
+                    if previous is None:
+                        inserted.append(doc_key)
+                        writes.append((doc_key, record))
+                    elif previous != row_hash:
+                        updated.append(doc_key)
+                        writes.append((doc_key, record))
+                    else:
+                        unchanged.append(doc_key)
+                existing = [doc_key for doc_key in known if doc_key.startswith(prefix)]
+            else:
+                # 원격 모드: 현재 문서를 batch get으로 받아 비교
+                collection_doc = self.db.collection(collection_name)
+                remote = {}
+                for i in range(0, len(docs), self.MAX_BATCH_SIZE):
+                    refs = [collection_doc.document(doc_key) for doc_key, _ in docs[i:i + self.MAX_BATCH_SIZE]]
+                    for doc in self.db.get_all(refs):
+                        if doc.exists:
+                            remote[doc.id] = doc.to_dict()
+                for doc_key, record in docs:
+                    if doc_key not in remote:
+                        inserted.append(doc_key)
+                        writes.append((doc_key, record))
+                    elif not self._records_equal(record, remote[doc_key]):
+                        updated.append(doc_key)
+                        writes.append((doc_key, record))
+                    else:
+                        unchanged.append(doc_key)
+                existing = list(self.iter_document_keys(collection_name, prefix=prefix)) if delete_missing else []
+
+            if delete_missing:
+                current = {doc_key for doc_key, _ in docs}
+                vanished = [doc_key for doc_key in existing if doc_key not in current]
+                deleted.extend(vanished)
+                writes.extend((doc_key, None) for doc_key in vanished)
+
+        summary = {"inserted": len(inserted), "updated": len(updated), "deleted": len(deleted),
+                   "unchanged": len(unchanged), "inserted_keys": inserted, "updated_keys": updated,
+                   "deleted_keys": deleted, "failed_batches": [], "dry_run": dry_run}
+        logging.info(f"Sync plan for {collection_name}: {len(inserted)} inserted, {len(updated)} updated, "
+                     f"{len(deleted)} deleted, {len(unchanged)} unchanged.")
+        if dry_run or not writes:
+            return summary
+
+        report, committed = self._write_batches(collection_name, writes, batch_size, max_workers, max_retries, backoff)
+        summary["failed_batches"] = [r for r in report if not r["success"]]
+
+        if manifest is not None:
+            # 커밋에 성공한 변경만 매니페스트에 반영한다
+            known = dict(known)
+            for doc_key in committed:
+                if doc_key in new_hashes:
+                    known[doc_key] = new_hashes[doc_key]
+                else:
+                    known.pop(doc_key, None)
+            for doc_key in unchanged:
+                known[doc_key] = new_hashes[doc_key]
+            manifest[collection_name] = known
+            self._save_manifest(manifest, manifest_path)
+        return summary
 
     def read_data(self, collection_name: str) -> pd.DataFrame:
+        return self._cached(collection_name, ("read_data",), lambda: self._read_data(collection_name))
+
+    def _read_data(self, collection_name: str) -> pd.DataFrame:
         logging.info(f"Reading data from collection: {collection_name}.")
         docs = self.db.collection(collection_name).stream()
         data = []
@@ -46,6 +312,88 @@ class FirestoreManager:
             logging.warning(f"No documents found in collection: {collection_name}.")
             return pd.DataFrame()
 
+    @staticmethod
+    def _get_field(doc, field_path: str):
+        try:
+            return doc.get(field_path)
+        except KeyError:
+            return None
+
+    @staticmethod
+    def _docs_to_dataframe(docs: list, select: list = None) -> pd.DataFrame:
+        """
+        문서 스냅샷 리스트를 열 단위로 모아 DataFrame을 만드는 함수.
+        문서마다 없는 필드는 None으로 채운다. select가 있으면 "a.c" 같은 중첩 필드 경로도 열 하나로 읽는다.
+        """
+        doc_ids = [doc.id for doc in docs]
+        if select:
+            columns = {field: [FirestoreManager._get_field(doc, field) for doc in docs] for field in select}
+            return pd.DataFrame(columns, index=doc_ids)
+        columns = {}
+        for i, doc in enumerate(docs):
+            for field, value in (doc.to_dict() or {}).items():
+                if field not in columns:
+                    columns[field] = [None] * i
+                columns[field].append(value)
+            for values in columns.values():
+                if len(values) < i + 1:
+                    values.append(None)
+        return pd.DataFrame(columns, index=doc_ids)
+
+    def read_data_chunks(self, collection_name: str, chunk_size: int = 1000, select: list = None,
+                         filters: list = None, order_by: str = None, descending: bool = False):
+        """
+        컬렉션을 커서 기반으로 페이지 단위로 읽어 DataFrame 조각을 순서대로 반환하는 제너레이터.
+        컬렉션 전체를 메모리에 올리지 않는다.
+
+        Args:
+            collection_name (str): 읽을 컬렉션 이름.
+            chunk_size (int): DataFrame 하나에 담을 문서 수.
+            select (list): 가져올 필드 목록. None이면 모든 필드. 정렬 필드가 없으면 조회에만 쓰고 결과에서는 뺀다.
+            filters (list): (field, op, value) 튜플 리스트. 예: [("price", ">", 100)]
+            order_by (str): 정렬 필드. None이면 부등호 필터 필드 또는 문서 ID 순으로 정렬.
+            descending (bool): True이면 내림차순 정렬.
+
+        Yields:
+            pd.DataFrame: 문서 키를 인덱스로 하는 최대 chunk_size 행의 DataFrame.
+        """
+        logging.info(f"Reading data from collection {collection_name} in chunks of {chunk_size}.")
+        query = self.db.collection(collection_name)
+        for field, op, value in filters or []:
+            query = query.where(filter=firestore.FieldFilter(field, op, value))
+            # 부등호 필터가 있으면 Firestore는 해당 필드로 먼저 정렬해야 한다
+            if order_by is None and op in ("<", "<=", ">", ">=", "!=", "not-in"):
+                order_by = field
+        # start_after(last_doc)는 스냅샷에서 정렬 필드 값을 읽으므로, 선택하지 않은 정렬 필드도 함께 가져온 뒤 결과에서 뺀다
+        extra_field = None
+        if select:
+            select = list(select)
+            if order_by and not any(order_by == field or order_by.startswith(f"{field}.") for field in select):
+                extra_field = order_by
+            if extra_field:
+                select.append(extra_field)
+            query = query.select(select)
+        direction = firestore.Query.DESCENDING if descending else firestore.Query.ASCENDING
+        query = query.order_by(order_by if order_by else "__name__", direction=direction)
+
+        last_doc = None
+        total = 0
+        while True:
+            page = query.start_after(last_doc) if last_doc is not None else query
+            docs = list(page.limit(chunk_size).stream())
+            if not docs:
+                break
+            total += len(docs)
+            last_doc = docs[-1]
+            logging.debug(f"Retrieved {len(docs)} documents from {collection_name} (total {total}).")
+            chunk = self._docs_to_dataframe(docs, select)
+            if extra_field is not None:
+                chunk = chunk.drop(columns=[extra_field])
+            yield chunk
+            if len(docs) < chunk_size:
+                break
+        logging.info(f"Finished reading {total} documents from collection {collection_name}.")
+
 
 
 
@@ -67,6 +415,7 @@ class FirestoreManager:
 
         try:
             doc_ref.set(data_dict)
+            self._on_write(collection_name, added=[doc_key])
             logging.info("Document saved successfully.")
         except Exception as e:
             logging.error(f"Error saving document: {e}")
@@ -84,14 +433,136 @@ class FirestoreManager:
         """
         logging.info(f"Fetching all document keys from collection '{collection_name}'")
         try:
-            docs = self.db.collection(collection_name).stream()
-            doc_keys = [doc.id for doc in docs]  # 문서의 id (키)를 추출
+            doc_keys = self._cached(collection_name, ("keys",),  # 필드 없이 문서 키만 조회
+                                    lambda: list(self.iter_document_keys(collection_name)))
             logging.info(f"Retrieved {len(doc_keys)} document keys successfully.")
             return doc_keys
         except Exception as e:
             logging.error(f"Error fetching document keys: {e}")
             return []   
             
+    def iter_document_keys(self, collection_name: str = "sample_collection", page_size: int = 1000,
+                           prefix: str = None):
+        """
+        필드 데이터 없이 문서 키만 페이지 단위로 조회하는 제너레이터.
+
+        Args:
+            collection_name (str): 컬렉션 이름 (기본값: "sample_collection").
+            page_size (int): 요청 한 번에 가져올 키 수.
+            prefix (str): 주어지면 이 접두어로 시작하는 키만 조회한다. 예: "prices_doc_"
+
+        Yields:
+            str: 문서 키.
+        """
+        collection_doc = self.db.collection(collection_name)
+        # "__name__"만 투영하면 문서 이름만 전송된다
+        query = collection_doc.select(["__name__"])
+        if prefix:
+            query = query.where(filter=firestore.FieldFilter("__name__", ">=", collection_doc.document(prefix)))
+            query = query.where(filter=firestore.FieldFilter("__name__", "<", collection_doc.document(prefix + "\uf8ff")))
+        query = query.order_by("__name__")
+        last_doc = None
+        while True:
+            page = query.start_after(last_doc) if last_doc is not None else query
+            docs = list(page.limit(page_size).stream())
+            for doc in docs:
+                yield doc.id
+            if len(docs) < page_size:
+                break
+            last_doc = docs[-1]
+
+    def which_exist(self, doc_keys: list, collection_name: str = "sample_collection",
+                    batch_size: int = 500, use_snapshot: bool = False) -> dict:
+        """
+        여러 문서 키의 존재 여부를 batch get으로 한 번에 확인하는 함수.
+
+        Args:
+            doc_keys (list): 확인할 문서 키 리스트.
+            collection_name (str): 확인할 컬렉션 이름 (기본값: "sample_collection").
+            batch_size (int): 요청 한 번에 확인할 키 수.
+            use_snapshot (bool): True이고 load_key_snapshot으로 받아둔 스냅샷이 있으면
+                                 네트워크 요청 없이 스냅샷에서 확인한다.
+
+        Returns:
+            dict: {doc_key: 존재 여부(bool)}.
+        """
+        doc_keys = list(dict.fromkeys(doc_keys))  # 순서를 유지하며 중복 제거
+        snapshot = self._key_snapshots.get(collection_name) if use_snapshot else None
+        if snapshot is not None:
+            logging.debug(f"Checking {len(doc_keys)} keys against the key snapshot of '{collection_name}'.")
+            return {doc_key: doc_key in snapshot for doc_key in doc_keys}
+
+        logging.info(f"Checking existence of {len(doc_keys)} documents in collection '{collection_name}'")
+        collection_doc = self.db.collection(collection_name)
+        exists = {}
+        for i in range(0, len(doc_keys), batch_size):
+            refs = [collection_doc.document(doc_key) for doc_key in doc_keys[i:i + batch_size]]
+            # 빈 field_paths는 필드 없이 존재 여부만 받아온다
+            for doc in self.db.get_all(refs, field_paths=[]):
+                exists[doc.id] = doc.exists
+        return {doc_key: exists.get(doc_key, False) for doc_key in doc_keys}
+
+    def load_key_snapshot(self, collection_name: str = "sample_collection") -> set:
+        """
+        컬렉션의 문서 키를 메모리에 스냅샷으로 저장하는 함수.
+        이후 which_exist(use_snapshot=True)는 네트워크 없이 확인하며,
+        이 매니저를 통한 저장/삭제는 스냅샷에 반영된다.
+
+        Args:
+            collection_name (str): 컬렉션 이름 (기본값: "sample_collection").
+
+        Returns:
+            set: 문서 키 집합.
+        """
+        keys = set(self.iter_document_keys(collection_name))
+        self._key_snapshots[collection_name] = keys
+        logging.info(f"Loaded key snapshot of {len(keys)} documents from collection '{collection_name}'.")
+        return keys
+
+    def drop_key_snapshot(self, collection_name: str = None):
+        """
+        저장된 키 스냅샷을 삭제하는 함수. collection_name이 None이면 모두 삭제한다.
+        """
+        if collection_name is None:
+            self._key_snapshots.clear()
+        else:
+            self._key_snapshots.pop(collection_name, None)
+
+    def _on_write(self, collection_name: str, added: list = (), removed: list = ()):
+        # 이 매니저를 통한 쓰기를 키 스냅샷과 읽기 캐시에 반영한다
+        snapshot = self._key_snapshots.get(collection_name)
+        if snapshot is not None:
+            snapshot.update(added)
+            snapshot.difference_update(removed)
+        if self.cache is not None and (added or removed):
+            self.cache.invalidate(collection_name)
+
+    def _cached(self, collection_name: str, key, loader):
+        if self.cache is None:
+            return loader()
+        return self.cache.get_or_load(collection_name, key, loader)
+
+    def watch_collection(self, collection_name: str):
+        """
+        컬렉션에 스냅샷 리스너를 등록해, 다른 프로세스가 데이터를 바꾸면 캐시를 무효화하는 함수.
+
+        Args:
+            collection_name (str): 감시할 컬렉션 이름.
+
+        Returns:
+            Watch: 리스너 객체. 감시를 멈추려면 unsubscribe()를 호출한다.
+        """
+        if self.cache is None:
+            raise ValueError("watch_collection은 cache가 설정된 경우에만 사용할 수 있습니다.")
+
+        def on_snapshot(col_snapshot, changes, read_time):
+            if changes:
+                self.cache.invalidate(collection_name)
+                logging.debug(f"{len(changes)} changes detected in {collection_name}; cache invalidated.")
+
+        logging.info(f"Watching collection {collection_name} for cache invalidation.")
+        return self.db.collection(collection_name).on_snapshot(on_snapshot)
+
     def is_doc_key_exist(self, doc_key: str, collection_name: str = "sample_collection") -> bool:
         """
         Firestore에서 doc_key가 중복되는지 확인하는 함수.
@@ -107,8 +578,8 @@ class FirestoreManager:
         doc_ref = self.db.collection(collection_name).document(doc_key)
 
         try:
-            doc = doc_ref.get()
-            if doc.exists:
+            exists = self._cached(collection_name, ("exists", doc_key), lambda: doc_ref.get().exists)
+            if exists:
                 logging.info(f"Document with key '{doc_key}' already exists.")
                 return True
             else:
@@ -132,6 +603,56 @@ class FirestoreManager:
 
         try:
             doc_ref.delete()
+            self._on_write(collection_name, removed=[doc_key])
             logging.info(f"Document with key '{doc_key}' deleted successfully.")
         except Exception as e:
-            logging.error(f"Error deleting document: {e}")
\ No newline at end of file
+            logging.error(f"Error deleting document: {e}")
+
+    def delete_documents(self, collection_name: str = "sample_collection", prefix: str = None, doc_keys: list = None,
+                         batch_size: int = 500, max_workers: int = 4, max_retries: int = 3,
+                         backoff: float = 1.0) -> dict:
+        """
+        컬렉션 전체, 키 접두어 또는 키 리스트에 해당하는 문서를 배치로 삭제하는 함수.
+        키만 페이지 단위로 조회하면서 batch_size * max_workers 개씩 병렬로 커밋한다.
+
+        Args:
+            collection_name (str): 컬렉션 이름 (기본값: "sample_collection").
+            prefix (str): 이 접두어로 시작하는 문서만 삭제한다. 예: "prices_doc_"
+            doc_keys (list): 삭제할 문서 키 리스트. None이면 컬렉션(또는 접두어)을 조회해 삭제한다.
+            batch_size, max_workers, max_retries, backoff: save_dataframe_bulk와 같다.
+
+        Returns:
+            dict: deleted, failed 개수, elapsed(초), docs_per_sec, failed_batches.
+        """
+        if doc_keys is not None:
+            keys = (doc_key for doc_key in doc_keys if not prefix or doc_key.startswith(prefix))
+        else:
+            keys = self.iter_document_keys(collection_name, page_size=1000, prefix=prefix)
+
+        logging.info(f"Deleting documents from collection '{collection_name}' (prefix: {prefix}).")
+        group_size = max(1, min(batch_size, self.MAX_BATCH_SIZE)) * max(1, max_workers)
+        summary = {"deleted": 0, "failed": 0, "elapsed": 0.0, "docs_per_sec": 0.0, "failed_batches": []}
+        start = time.perf_counter()
+        group = []
+        for doc_key in keys:
+            group.append((doc_key, None))
+            if len(group) < group_size:
+                continue
+            self._delete_group(collection_name, group, summary, batch_size, max_workers, max_retries, backoff, start)
+            group = []
+        if group:
+            self._delete_group(collection_name, group, summary, batch_size, max_workers, max_retries, backoff, start)
+
+        logging.info(f"Deleted {summary['deleted']} documents from '{collection_name}' in {summary['elapsed']:.2f}s "
+                     f"({summary['docs_per_sec']:.1f} docs/sec, {summary['failed']} failed).")
+        return summary
+
+    def _delete_group(self, collection_name, group, summary, batch_size, max_workers, max_retries, backoff, start):
+        report, committed = self._write_batches(collection_name, group, batch_size, max_workers, max_retries, backoff)
+        summary["deleted"] += len(committed)
+        summary["failed"] += len(group) - len(committed)
+        summary["failed_batches"].extend(r for r in report if not r["success"])
+        summary["elapsed"] = time.perf_counter() - start
+        summary["docs_per_sec"] = summary["deleted"] / summary["elapsed"] if summary["elapsed"] > 0 else 0.0
+        logging.info(f"Progress: {summary['deleted']} documents deleted from '{collection_name}' "
+                     f"({summary['docs_per_sec']:.1f} docs/sec).")
\ No newline at end of file
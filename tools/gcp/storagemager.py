@@ -1,20 +1,127 @@
+import base64
+import functools
+import gzip
+import hashlib
+import heapq
+import json
 import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from google.cloud import storage
+from google.cloud.storage import transfer_manager
 from google.oauth2 import service_account
 from datetime import timedelta
+import pandas as pd
+
+try:
+    import google_crc32c
+except ImportError:  # google-cloud-storage와 함께 설치되지만, 없으면 MD5만 비교한다
+    google_crc32c = None
+
+
+def _track_requests(func):
+    """
+    public 메서드 호출 횟수와 그 안에서 발생한 HTTP 요청 수를 집계하는 데코레이터.
+    """
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        outer = getattr(self._local, "method", None)
+        if outer is not None:
+            # 다른 public 메서드 안에서 호출되면 바깥 메서드에 집계한다
+            return func(self, *args, **kwargs)
+        self._local.method = func.__name__
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            self._local.method = None
+            with self._stats_lock:
+                stats = self._request_stats.setdefault(func.__name__, {"calls": 0, "requests": 0})
+                stats["calls"] += 1
+    return wrapper
+
 
 class StorageManager:
-    def __init__(self, credentials_file=None):
+    def __init__(self, credentials_file=None, lazy_buckets=False):
+        """
+        Args:
+        credentials_file (str): 서비스 계정 JSON 경로. None이면 기본 자격 증명 사용
+        lazy_buckets (bool): True이면 버킷 존재 확인 없이 버킷 참조만 만들어 사용 (메타데이터 요청 생략)
+        """
         if credentials_file is not None:
             self.credentials = service_account.Credentials.from_service_account_file(credentials_file)
             logging.info("Credentials loaded successfully.")
             self.client = storage.Client(credentials=self.credentials)
         else:
             self.client = storage.Client()
+        self._signed_url_cache = {}  # (bucket, blob, hours) -> (url, 재사용 가능 시각)
+        self._signed_url_expiry = []  # (재사용 가능 시각, key) 힙. 지난 항목을 삽입할 때 정리한다
+        self._signed_url_lock = threading.Lock()
+        self.lazy_buckets = lazy_buckets
+        self._buckets = {}  # 버킷 이름 -> Bucket 핸들
+        self._buckets_lock = threading.Lock()
+
+        # 메서드별 HTTP 요청 수 집계
+        self._local = threading.local()
+        self._request_stats = {}
+        self._stats_lock = threading.Lock()
+        self.client._http.hooks["response"].append(self._on_response)
         logging.info("Google Cloud Storage client initialized successfully.")
 
+    def _on_response(self, response, *args, **kwargs):
+        method = getattr(self._local, "method", None) or "other"
+        with self._stats_lock:
+            stats = self._request_stats.setdefault(method, {"calls": 0, "requests": 0})
+            stats["requests"] += 1
+        return response
+
+    def _bind_method(self, func):
+        # 스레드 풀 작업자의 요청도 호출한 public 메서드에 집계되도록 메서드 이름을 넘긴다
+        method = getattr(self._local, "method", None)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            self._local.method = method
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._local.method = None
+        return wrapper
+
+    def get_request_stats(self):
+        """
+        public 메서드별 호출 수(calls), HTTP 요청 수(requests), 호출당 요청 수를 반환하는 함수
+        """
+        with self._stats_lock:
+            return {method: dict(stats, requests_per_call=stats["requests"] / stats["calls"] if stats["calls"] else None)
+                    for method, stats in self._request_stats.items()}
+
+    def reset_request_stats(self):
+        with self._stats_lock:
+            self._request_stats.clear()
+
+    def _get_bucket(self, bucket_name):
+        """
+        버킷 핸들을 캐시해 메서드마다 반복되는 get_bucket 요청을 없애는 함수.
+        lazy_buckets이면 요청 없이 참조만 만든다.
+        """
+        with self._buckets_lock:
+            bucket = self._buckets.get(bucket_name)
+        if bucket is None:
+            bucket = self.client.bucket(bucket_name) if self.lazy_buckets else self.client.get_bucket(bucket_name)
+            with self._buckets_lock:
+                bucket = self._buckets.setdefault(bucket_name, bucket)
+        return bucket
+
+    def clear_bucket_cache(self):
+        with self._buckets_lock:
+            self._buckets.clear()
+
+    @_track_requests
     def upload_file(self, bucket_name, file_path, destination_blob_name, make_public=False):
-            bucket = self.client.get_bucket(bucket_name)
+            bucket = self._get_bucket(bucket_name)
             blob = bucket.blob(destination_blob_name)
             blob.upload_from_filename(file_path)
             
@@ -25,37 +132,429 @@ class StorageManager:
             logging.info(f"File {file_path} uploaded to {destination_blob_name}.")
 
 
+    @_track_requests
     def download_file(self, bucket_name, blob_name, destination_file_path):
-        bucket = self.client.get_bucket(bucket_name)
+        bucket = self._get_bucket(bucket_name)
         blob = bucket.blob(blob_name)
         blob.download_to_filename(destination_file_path)
         logging.info(f"File {blob_name} downloaded to {destination_file_path}.")
 
     
-    def list_files_in_bucket(self, bucket_name):
-        bucket = self.client.get_bucket(bucket_name)
-        blobs = bucket.list_blobs()
-        sorted_blobs = sorted(blobs, key=lambda blob: blob.time_created)
-        return [blob.name for blob in sorted_blobs]
+    @staticmethod
+    def _with_retry(func, max_retries=3, backoff=1.0):
+        """
+        전송 함수를 실행하고, 실패하면 지수 백오프로 재시도하는 함수.
+
+        Returns:
+        tuple: (성공 여부, 시도 횟수, 오류 메시지)
+        """
+        error = None
+        for attempt in range(max_retries + 1):
+            try:
+                func()
+                return True, attempt + 1, None
+            except Exception as e:
+                error = str(e)
+                logging.warning(f"Transfer failed (attempt {attempt + 1}/{max_retries + 1}): {e}")
+                if attempt < max_retries:
+                    time.sleep(backoff * (2 ** attempt))
+        return False, max_retries + 1, error
+
+    @staticmethod
+    def _transfer_summary(results, elapsed):
+        transferred = sum(r["bytes"] for r in results if r["success"])
+        failed = [r["name"] for r in results if not r["success"]]
+        return {
+            "files": len(results),
+            "succeeded": len(results) - len(failed),
+            "failed": failed,
+            "bytes": transferred,
+            "elapsed": elapsed,
+            "bytes_per_sec": transferred / elapsed if elapsed > 0 else 0.0,
+            "results": results,
+        }
+
+    @_track_requests
+    def upload_directory(self, bucket_name, local_dir, prefix="", max_workers=8, make_public=False,
+                         max_retries=3, backoff=1.0, slice_threshold=256 * 1024 ** 2, worker_type="thread"):
+        """
+        로컬 디렉토리의 모든 파일을 병렬로 업로드하는 함수
+
+        Args:
+        bucket_name (str): 버킷 이름
+        local_dir (str | Path): 업로드할 로컬 디렉토리
+        prefix (str): 블롭 이름 앞에 붙일 경로 (예: "images/2024")
+        max_workers (int): 동시에 전송할 파일 수
+        make_public (bool): True이면 업로드 후 공개로 설정
+        max_retries (int): 파일별 재시도 횟수
+        backoff (float): 재시도 대기 시간의 기준값(초)
+        slice_threshold (int): 이 크기(바이트) 이상인 파일은 여러 조각으로 나눠 동시에 전송. None이면 사용하지 않음
+        worker_type (str): 조각 전송에 사용할 작업자 종류 ("thread" 또는 "process")
+
+        Returns:
+        dict: files, succeeded, failed(실패한 블롭 이름), bytes, elapsed, bytes_per_sec, results(파일별 결과)
+        """
+        bucket = self._get_bucket(bucket_name)
+        local_dir = Path(local_dir)
+        prefix = prefix.strip("/")
+        files = [(path, self._blob_name(prefix, path.relative_to(local_dir).as_posix()))
+                 for path in local_dir.rglob("*") if path.is_file()]
+
+        logging.info(f"Uploading {len(files)} files from {local_dir} to {bucket_name}/{prefix}.")
+        return self._upload_files(bucket, files, max_workers, make_public, max_retries, backoff,
+                                  slice_threshold, worker_type)
+
+    @staticmethod
+    def _blob_name(prefix, relative):
+        return f"{prefix}/{relative}" if prefix else relative
+
+    def _upload_files(self, bucket, files, max_workers=8, make_public=False, max_retries=3, backoff=1.0,
+                      slice_threshold=256 * 1024 ** 2, worker_type="thread"):
+        """
+        (로컬 경로, 블롭 이름) 리스트를 병렬로 업로드하고 전송 요약을 반환하는 함수.
+        """
+        def upload(item):
+            path, blob_name = item
+            blob = bucket.blob(blob_name)
+            size = path.stat().st_size
+
+            def send():
+                if slice_threshold is not None and size >= slice_threshold:
+                    transfer_manager.upload_chunks_concurrently(str(path), blob, worker_type=worker_type)
+                else:
+                    blob.upload_from_filename(str(path))
+                if make_public:
+                    blob.make_public()
+
+            success, attempts, error = self._with_retry(send, max_retries, backoff)
+            logging.debug(f"File {path} uploaded to {blob_name}: {success}.")
+            return {"name": blob_name, "bytes": size, "success": success, "attempts": attempts, "error": error}
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self._bind_method(upload), files))
+        summary = self._transfer_summary(results, time.perf_counter() - start)
+        logging.info(f"Uploaded {summary['succeeded']}/{summary['files']} files "
+                     f"({summary['bytes_per_sec'] / 1024 ** 2:.2f} MB/s).")
+        return summary
+
+    @staticmethod
+    def _file_hashes(path):
+        """
+        로컬 파일의 MD5와 CRC32C를 GCS 메타데이터와 같은 base64 형식으로 계산하는 함수.
+        """
+        md5 = hashlib.md5()
+        crc = google_crc32c.Checksum() if google_crc32c is not None else None
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                md5.update(chunk)
+                if crc is not None:
+                    crc.update(chunk)
+        return {
+            "md5": base64.b64encode(md5.digest()).decode("ascii"),
+            "crc32c": base64.b64encode(crc.digest()).decode("ascii") if crc is not None else None,
+        }
+
+    @staticmethod
+    def _is_same_file(blob, entry):
+        if blob is None or blob.size != entry["size"]:
+            return False
+        if blob.md5_hash:
+            return blob.md5_hash == entry["md5"]
+        # 분할 업로드로 만든 객체에는 MD5가 없으므로 CRC32C로 비교한다
+        if blob.crc32c and entry["crc32c"]:
+            return blob.crc32c == entry["crc32c"]
+        return False
+
+    @_track_requests
+    def sync(self, local_dir, bucket_name, prefix="", delete_orphans=False, dry_run=False, manifest_path=None,
+             max_workers=8, make_public=False, max_retries=3, backoff=1.0, slice_threshold=256 * 1024 ** 2,
+             worker_type="thread"):
+        """
+        로컬 디렉토리와 버킷의 prefix 경로를 비교해, 새로 생기거나 바뀐 파일만 업로드하는 함수 (rsync 방식)
+        크기와 MD5(없으면 CRC32C)를 블롭 메타데이터와 비교하며,
+        로컬 해시는 크기/수정 시각을 키로 매니페스트에 저장해 바뀌지 않은 파일은 다시 계산하지 않는다.
+
+        Args:
+        local_dir (str | Path): 업로드할 로컬 디렉토리
+        bucket_name (str): 버킷 이름
+        prefix (str): 버킷 안의 대상 경로
+        delete_orphans (bool): True이면 로컬에 없는 원격 파일을 삭제
+        dry_run (bool): True이면 전송 없이 옮길 목록만 반환
+        manifest_path (str | Path): 해시 매니페스트 경로 (기본값: local_dir/.storage_sync.json)
+        max_workers, make_public, max_retries, backoff, slice_threshold, worker_type: upload_directory와 같음
+
+        Returns:
+        dict: upload(업로드할 블롭 이름), delete(삭제할 블롭 이름), unchanged(개수), dry_run, transfer(전송 요약)
+        """
+        local_dir = Path(local_dir)
+        prefix = prefix.strip("/")
+        manifest_path = Path(manifest_path) if manifest_path else local_dir / ".storage_sync.json"
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (FileNotFoundError, ValueError):
+            manifest = {}
+
+        # 원격 상태: 이름, 크기, 해시만 조회
+        remote = {}
+        for blob in self.client.list_blobs(bucket_name, prefix=f"{prefix}/" if prefix else None,
+                                           fields="items(name,size,md5Hash,crc32c),nextPageToken"):
+            remote[blob.name] = blob
+
+        to_upload, unchanged, local_names = [], 0, set()
+        new_manifest = {}
+        for path in local_dir.rglob("*"):
+            if not path.is_file() or path == manifest_path:
+                continue
+            relative = path.relative_to(local_dir).as_posix()
+            blob_name = self._blob_name(prefix, relative)
+            local_names.add(blob_name)
+            stat = path.stat()
+
+            entry = manifest.get(relative)
+            if entry is None or entry["size"] != stat.st_size or entry["mtime_ns"] != stat.st_mtime_ns:
+                entry = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, **self._file_hashes(path)}
+            new_manifest[relative] = entry
+
+            if self._is_same_file(remote.get(blob_name), entry):
+                unchanged += 1
+            else:
+                to_upload.append((path, blob_name))
+
+        to_delete = sorted(set(remote) - local_names) if delete_orphans else []
+        summary = {"upload": [blob_name for _, blob_name in to_upload], "delete": to_delete,
+                   "unchanged": unchanged, "dry_run": dry_run, "transfer": None, "delete_failed": []}
+        logging.info(f"Sync {local_dir} -> {bucket_name}/{prefix}: {len(to_upload)} to upload, "
+                     f"{len(to_delete)} to delete, {unchanged} unchanged.")
+
+        if not dry_run:
+            bucket = self._get_bucket(bucket_name)
+            if to_upload:
+                summary["transfer"] = self._upload_files(bucket, to_upload, max_workers, make_public, max_retries,
+                                                         backoff, slice_threshold, worker_type)
+            if to_delete:
+                def delete(name):
+                    return self._with_retry(lambda: bucket.blob(name).delete(), max_retries, backoff)[0]
+
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    deleted = list(executor.map(self._bind_method(delete), to_delete))
+                summary["delete_failed"] = [name for name, ok in zip(to_delete, deleted) if not ok]
+                logging.info(f"Deleted {sum(deleted)}/{len(to_delete)} orphaned files from {bucket_name}/{prefix}.")
+
+        tmp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(new_manifest, f)
+        os.replace(tmp_path, manifest_path)
+        return summary
+
+    @_track_requests
+    def download_prefix(self, bucket_name, prefix, local_dir, max_workers=8, max_retries=3, backoff=1.0,
+                        slice_threshold=256 * 1024 ** 2, worker_type="thread"):
+        """
+        버킷에서 prefix로 시작하는 모든 파일을 병렬로 다운로드하는 함수
+
+        Args:
+        bucket_name (str): 버킷 이름
+        prefix (str): 다운로드할 블롭 폴더 경로 (예: "images/2024"). 끝에 "/"가 없으면 붙여서 조회한다
+        local_dir (str | Path): 저장할 로컬 디렉토리. prefix 아래의 경로 구조를 유지한다
+        max_workers, max_retries, backoff, slice_threshold, worker_type: upload_directory와 같음
+
+        Returns:
+        dict: files, succeeded, failed(실패한 블롭 이름), bytes, elapsed, bytes_per_sec, results(파일별 결과)
+        """
+        local_dir = Path(local_dir)
+        root = local_dir.resolve()
+        # "images"가 "images2/..."까지 포함하지 않도록 폴더 경계에 맞춘다
+        if prefix and not prefix.endswith("/"):
+            prefix = f"{prefix}/"
+        blobs = [blob for blob in self.client.list_blobs(bucket_name, prefix=prefix) if not blob.name.endswith("/")]
+
+        def download(blob):
+            relative = blob.name[len(prefix):].lstrip("/") if prefix else blob.name
+            destination = (local_dir / relative).resolve()
+            # "../" 등이 들어간 블롭 이름으로 local_dir 밖에 쓰지 않도록 한다
+            if root not in destination.parents:
+                logging.error(f"Skipping {blob.name}: destination is outside {local_dir}.")
+                return {"name": blob.name, "bytes": 0, "success": False, "attempts": 0,
+                        "error": "destination outside local_dir"}
+            destination.parent.mkdir(parents=True, exist_ok=True)
+
+            def receive():
+                if slice_threshold is not None and (blob.size or 0) >= slice_threshold:
+                    transfer_manager.download_chunks_concurrently(blob, str(destination), worker_type=worker_type)
+                else:
+                    blob.download_to_filename(str(destination))
+
+            success, attempts, error = self._with_retry(receive, max_retries, backoff)
+            if not success and os.path.exists(destination):
+                os.remove(destination)  # 일부만 받은 파일은 남기지 않는다
+            logging.debug(f"File {blob.name} downloaded to {destination}: {success}.")
+            return {"name": blob.name, "bytes": blob.size or 0, "success": success, "attempts": attempts, "error": error}
+
+        logging.info(f"Downloading {len(blobs)} files from {bucket_name}/{prefix} to {local_dir}.")
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self._bind_method(download), blobs))
+        summary = self._transfer_summary(results, time.perf_counter() - start)
+        logging.info(f"Downloaded {summary['succeeded']}/{summary['files']} files "
+                     f"({summary['bytes_per_sec'] / 1024 ** 2:.2f} MB/s).")
+        return summary
+
+    # 이름과 생성 시각만 받아오는 목록 조회 필드
+    _LIST_FIELDS = "items(name,timeCreated),prefixes,nextPageToken"
+
+    def iter_files_in_bucket(self, bucket_name, prefix=None, delimiter=None, page_size=1000, with_time=False):
+        """
+        버킷의 파일을 페이지 단위로 조회하며 하나씩 반환하는 제너레이터.
+        이름과 생성 시각만 받아오므로 전체 메타데이터를 메모리에 올리지 않는다.
+
+        Args:
+        bucket_name (str): 버킷 이름
+        prefix (str): 이 경로로 시작하는 파일만 조회 (예: "images/2024/")
+        delimiter (str): "/"이면 prefix 바로 아래 파일만 조회 (하위 폴더 제외)
+        page_size (int): 요청 한 번에 받아올 항목 수
+        with_time (bool): True이면 (이름, 생성 시각) 튜플을 반환
+
+        Yields:
+        str | tuple: 파일 이름 또는 (파일 이름, 생성 시각)
+        """
+        blobs = self.client.list_blobs(bucket_name, prefix=prefix, delimiter=delimiter,
+                                       page_size=page_size, fields=self._LIST_FIELDS)
+        for blob in blobs:
+            yield (blob.name, blob.time_created) if with_time else blob.name
+
+    @staticmethod
+    def _dataframe_format(blob_name, file_format):
+        if file_format is not None:
+            return file_format
+        return "parquet" if blob_name.endswith(".parquet") else "csv"
+
+    @_track_requests
+    def upload_dataframe(self, df, bucket_name, blob_name, file_format=None, compression="infer",
+                         chunk_size=8 * 1024 ** 2, row_group_size=None):
+        """
+        DataFrame을 임시 파일 없이 재개 가능한(resumable) 업로드로 바로 버킷에 쓰는 함수
+
+        Args:
+        df (pd.DataFrame): 업로드할 데이터
+        bucket_name (str): 버킷 이름
+        blob_name (str): 저장할 블롭 이름 (예: "tables/prices.parquet", "tables/prices.csv.gz")
+        file_format (str): "parquet" 또는 "csv". None이면 확장자로 판단
+        compression (str): parquet은 압축 코덱("snappy", "gzip", "zstd" 등, "infer"이면 snappy),
+                           csv는 "gzip" 또는 None ("infer"이면 .gz 확장자일 때 gzip)
+        chunk_size (int): 업로드 조각 크기(바이트, 256KB의 배수). 메모리에는 이 크기만큼만 버퍼링된다
+        row_group_size (int): parquet 행 그룹 크기. 작을수록 read_dataframe에서 일부만 읽기 쉽다
+        """
+        file_format = self._dataframe_format(blob_name, file_format)
+        blob = self._get_bucket(bucket_name).blob(blob_name)
+        content_type = "application/octet-stream" if file_format == "parquet" else "text/csv"
+        if compression == "infer":
+            compression = "snappy" if file_format == "parquet" else ("gzip" if blob_name.endswith(".gz") else None)
+
+        with blob.open("wb", chunk_size=chunk_size, ignore_flush=True, content_type=content_type) as writer:
+            if file_format == "parquet":
+                df.to_parquet(writer, index=False, compression=compression, row_group_size=row_group_size)
+            elif compression == "gzip":
+                with gzip.GzipFile(fileobj=writer, mode="wb") as gz:
+                    df.to_csv(gz, index=False, encoding="utf-8", chunksize=100_000)
+            else:
+                df.to_csv(writer, index=False, encoding="utf-8", chunksize=100_000)
+        logging.info(f"DataFrame ({len(df)} rows) uploaded to {bucket_name}/{blob_name} as {file_format}.")
+
+    @_track_requests
+    def read_dataframe(self, bucket_name, blob_name, file_format=None, columns=None, row_groups=None,
+                       compression="infer", chunk_size=8 * 1024 ** 2, **read_kwargs):
+        """
+        버킷의 parquet/csv 파일을 임시 파일 없이 바로 DataFrame으로 읽는 함수
+
+        Args:
+        bucket_name (str): 버킷 이름
+        blob_name (str): 읽을 블롭 이름
+        file_format (str): "parquet" 또는 "csv". None이면 확장자로 판단
+        columns (list): 읽을 열 목록. None이면 모든 열
+        row_groups (list): parquet에서 읽을 행 그룹 번호 목록. None이면 모든 행 그룹
+        compression (str): csv 압축 형식. "infer"이면 .gz 확장자일 때 gzip
+        chunk_size (int): 다운로드 조각 크기(바이트)
+        read_kwargs: csv일 때 pd.read_csv에 넘길 추가 인자 (예: chunksize, dtype)
+
+        Returns:
+        pd.DataFrame: 읽은 데이터 (csv에서 chunksize를 주면 DataFrame 반복자)
+        """
+        file_format = self._dataframe_format(blob_name, file_format)
+        blob = self._get_bucket(bucket_name).blob(blob_name)
+
+        if file_format == "parquet":
+            import pyarrow.parquet as pq
+
+            # BlobReader는 seek를 지원하므로 footer와 필요한 열/행 그룹 범위만 받아온다
+            with blob.open("rb", chunk_size=chunk_size) as reader:
+                parquet_file = pq.ParquetFile(reader)
+                if row_groups is not None:
+                    table = parquet_file.read_row_groups(row_groups, columns=columns)
+                else:
+                    table = parquet_file.read(columns=columns)
+            df = table.to_pandas()
+        else:
+            if compression == "infer":
+                compression = "gzip" if blob_name.endswith(".gz") else None
+            reader = blob.open("rb", chunk_size=chunk_size)
+            stream = gzip.GzipFile(fileobj=reader, mode="rb") if compression == "gzip" else reader
+            df = pd.read_csv(stream, usecols=columns, **read_kwargs)
+            if not read_kwargs.get("chunksize") and not read_kwargs.get("iterator"):
+                stream.close()
+                reader.close()
+        logging.info(f"DataFrame loaded from {bucket_name}/{blob_name}.")
+        return df
+
+    @_track_requests
+    def list_files_in_bucket(self, bucket_name, prefix=None, delimiter=None, newest=None, oldest=None):
+        """
+        버킷의 파일 이름을 생성 시각 순으로 반환하는 함수
+
+        Args:
+        bucket_name (str): 버킷 이름
+        prefix (str): 이 경로로 시작하는 파일만 조회
+        delimiter (str): "/"이면 prefix 바로 아래 파일만 조회
+        newest (int): 주어지면 가장 최근 파일 N개를 최신순으로 반환 (N개 크기의 힙만 유지)
+        oldest (int): 주어지면 가장 오래된 파일 N개를 오래된 순으로 반환
+
+        Returns:
+        list: 파일 이름 리스트. newest/oldest가 없으면 전체를 오래된 순으로 반환
+        """
+        files = self.iter_files_in_bucket(bucket_name, prefix=prefix, delimiter=delimiter, with_time=True)
+        by_time = lambda item: item[1]
+        if newest is not None:
+            selected = heapq.nlargest(newest, files, key=by_time)
+        elif oldest is not None:
+            selected = heapq.nsmallest(oldest, files, key=by_time)
+        else:
+            selected = sorted(files, key=by_time)
+        return [name for name, _ in selected]
         
     
 
+    @_track_requests
     def make_file_public(self, bucket_name, blob_name):
-        bucket = self.client.get_bucket(bucket_name)
+        bucket = self._get_bucket(bucket_name)
         blob = bucket.blob(blob_name)
         blob.make_public()
         logging.info(f"File {blob_name} is publicly accessible at: {blob.public_url}")
         return blob.public_url
     
+    @_track_requests
     def bucket_exists(self, bucket_name):
         try:
-            self.client.get_bucket(bucket_name)
+            bucket = self.client.get_bucket(bucket_name)
+            with self._buckets_lock:
+                self._buckets[bucket_name] = bucket
             logging.info(f"Bucket {bucket_name} exists.")
             return True
         except Exception as e:
             logging.error(f"Bucket {bucket_name} does not exist: {e}")
             return False
 
+    @_track_requests
     def get_url_if_file_exists(self, bucket_name, file_name, signed_expiration_hours=1, use_public=False):
             """
             버킷에서 파일명이 존재하면 Public URL 또는 Signed URL을 반환하는 함수
@@ -70,27 +569,80 @@ class StorageManager:
             str: 파일이 존재하면 Public URL 또는 Signed URL 반환, 없으면 None 반환
             """
             try:
-                bucket = self.client.get_bucket(bucket_name)
-                blobs = bucket.list_blobs()
-
-                for blob in blobs:
-                    if blob.name == file_name:
-                        if use_public and blob.public_url:
-                            # 공개 URL을 반환
-                            logging.info(f"File {file_name} found. Public URL: {blob.public_url}")
-                            return blob.public_url
-                        
-                        else:
-                            # Signed URL 생성
-                            url = blob.generate_signed_url(
-                                version="v4",
-                                expiration=timedelta(hours=signed_expiration_hours),  # URL 유효 기간 설정
-                                method="GET"  )
-                            logging.info(f"File {file_name} found. Signed URL: {url}")
-                            return url
-                
-                logging.info(f"File {file_name} not found in bucket {bucket_name}.")
-                return None
+                bucket = self._get_bucket(bucket_name)
+                # 버킷 전체를 나열하지 않고 객체 메타데이터를 직접 조회한다
+                blob = bucket.get_blob(file_name)
+                if blob is None:
+                    logging.info(f"File {file_name} not found in bucket {bucket_name}.")
+                    return None
+
+                url = self._blob_url(blob, signed_expiration_hours, use_public)
+                logging.info(f"File {file_name} found. URL: {url}")
+                return url
             except Exception as e:
                 logging.error(f"Error while checking for file: {e}")
-                return None
\ No newline at end of file
+                return None
+
+    # 캐시한 Signed URL을 재사용하려면 남은 유효 기간이 요청한 기간의 이 비율 이상이어야 한다
+    SIGNED_URL_MIN_REMAINING = 0.95
+
+    def _blob_url(self, blob, signed_expiration_hours=1, use_public=False):
+        if use_public:
+            # 공개 URL은 네트워크 요청 없이 만들어진다
+            return blob.public_url
+
+        # Signed URL은 로컬에서 서명하며, 남은 유효 기간이 요청한 기간의 SIGNED_URL_MIN_REMAINING 이상일 때만 재사용한다
+        key = (blob.bucket.name, blob.name, signed_expiration_hours)
+        now = time.time()
+        with self._signed_url_lock:
+            cached = self._signed_url_cache.get(key)
+            if cached is not None and cached[1] > now:
+                return cached[0]
+
+        url = blob.generate_signed_url(
+            version="v4",
+            expiration=timedelta(hours=signed_expiration_hours),  # URL 유효 기간 설정
+            method="GET")
+        reuse_until = now + signed_expiration_hours * 3600 * (1 - self.SIGNED_URL_MIN_REMAINING)
+        with self._signed_url_lock:
+            # 더 이상 재사용할 수 없는 항목을 지워 캐시가 최근에 서명한 URL만 갖도록 한다
+            while self._signed_url_expiry and self._signed_url_expiry[0][0] <= now:
+                _, expired_key = heapq.heappop(self._signed_url_expiry)
+                entry = self._signed_url_cache.get(expired_key)
+                if entry is not None and entry[1] <= now:
+                    del self._signed_url_cache[expired_key]
+            self._signed_url_cache[key] = (url, reuse_until)
+            heapq.heappush(self._signed_url_expiry, (reuse_until, key))
+        return url
+
+    @_track_requests
+    def get_urls(self, bucket_name, file_names, signed_expiration_hours=1, use_public=False,
+                 check_exists=True, max_workers=16):
+        """
+        여러 파일의 Public URL 또는 Signed URL을 한 번에 반환하는 함수
+
+        Args:
+        bucket_name (str): 버킷 이름
+        file_names (list): 파일 이름 리스트
+        signed_expiration_hours (int): Signed URL 유효 기간 (기본값은 1시간)
+        use_public (bool): True이면 Public URL, False이면 Signed URL을 사용
+        check_exists (bool): True이면 파일 존재 여부를 병렬로 확인하고, False이면 확인 없이 URL을 만든다
+        max_workers (int): 존재 여부를 확인할 스레드 수
+
+        Returns:
+        dict: {파일 이름: URL}, 존재하지 않는 파일은 None
+        """
+        bucket = self._get_bucket(bucket_name)
+        file_names = list(dict.fromkeys(file_names))
+
+        if check_exists:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                blobs = list(executor.map(self._bind_method(bucket.get_blob), file_names))
+        else:
+            blobs = [bucket.blob(file_name) for file_name in file_names]
+
+        urls = {file_name: self._blob_url(blob, signed_expiration_hours, use_public) if blob is not None else None
+                for file_name, blob in zip(file_names, blobs)}
+        missing = sum(url is None for url in urls.values())
+        logging.info(f"Resolved {len(urls) - missing}/{len(urls)} URLs in bucket {bucket_name}.")
+        return urls
\ No newline at end of file
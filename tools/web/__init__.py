@@ -1,2 +1,3 @@
 from .webdriver import WebDriver as WebDriver
 from .installer import Installer as Installer
+from .webdriverpool import WebDriverPool as WebDriverPool
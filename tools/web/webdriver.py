@@ -1,6 +1,7 @@
 from selenium import webdriver
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 import time
@@ -13,6 +14,7 @@ class WebDriver:
         self.SELENIUM_URL = os.getenv('SELENIUM_URL')
         self.headless= headless
         self.driver = None
+        self.last_scroll_stats = None
         if self.SELENIUM_URL is not None: logging.info("Using remote WebDriver.")
         self._init_chrome()
 
@@ -74,60 +76,161 @@ class WebDriver:
         logging.debug(f"Element moved to center at ({target_x}, {target_y}).")
         return None
 
-    def getDistanceScrollToBtm(self):
-        """ 스크롤을 페이지 아래로 내립니다. """
-        logging.debug("Scrolling to the bottom of the page.")
+    # 한 번의 JS 호출로 스크롤 위치, 문서 높이, 뷰포트 높이를 함께 읽는다
+    _SCROLL_STATE_JS = """
+        var doc = document.documentElement, body = document.body || doc;
+        return {
+            y: window.scrollY || window.pageYOffset || 0,
+            height: Math.max(body.scrollHeight, doc.scrollHeight),
+            viewport: window.innerHeight
+        };
+    """
+    # 맨 아래로 즉시 스크롤하고 이동 전/후 위치와 문서 높이를 반환한다
+    _SCROLL_TO_BOTTOM_JS = """
+        var doc = document.documentElement, body = document.body || doc;
+        var before = window.scrollY || window.pageYOffset || 0;
+        var height = Math.max(body.scrollHeight, doc.scrollHeight);
+        window.scrollTo({top: height, left: 0, behavior: 'instant'});
+        return {before: before, after: window.scrollY || window.pageYOffset || 0, height: height};
+    """
+
+    def get_scroll_state(self) -> dict:
+        """ 현재 스크롤 위치(y), 문서 높이(height), 뷰포트 높이(viewport)를 반환합니다. """
+        return self.driver.execute_script(self._SCROLL_STATE_JS)
+
+    def wait_for(self, condition, timeout=5.0, poll=0.05):
+        """
+        condition(driver)이 참이 될 때까지 짧은 간격으로 확인합니다.
+
+        Returns:
+            condition의 마지막 반환값. 시간 안에 참이 되지 않으면 None
+        """
+        try:
+            return WebDriverWait(self.driver, timeout, poll_frequency=poll).until(condition)
+        except TimeoutException:
+            return None
+
+    def wait_for_scroll_settled(self, timeout=2.0, poll=0.05) -> bool:
+        """ 스크롤 위치가 연속 두 번 같은 값으로 읽힐 때까지 기다립니다 (부드러운 스크롤 대응). """
+        last = [None]
+
+        def settled(driver):
+            y = driver.execute_script("return window.scrollY || window.pageYOffset || 0;")
+            done = y == last[0]
+            last[0] = y
+            return done
+
+        return self.wait_for(settled, timeout, poll) is not None
+
+    def wait_for_height_change(self, previous_height, timeout=3.0, poll=0.05):
+        """ 문서 높이(scrollHeight)가 previous_height와 달라질 때까지 기다립니다. 바뀐 높이 또는 None을 반환합니다. """
+        def grown(driver):
+            height = driver.execute_script(
+                "return Math.max(document.body.scrollHeight, document.documentElement.scrollHeight);")
+            return height if height != previous_height else False
+
+        return self.wait_for(grown, timeout, poll)
+
+    def wait_for_network_idle(self, idle_time=0.5, timeout=10.0, poll=0.1) -> bool:
+        """
+        문서 로딩이 끝나고 idle_time 동안 새 리소스 요청(performance 리소스 항목)이 없을 때까지 기다립니다.
+        """
+        state = {"count": None, "since": time.monotonic()}
+
+        def idle(driver):
+            ready, count = driver.execute_script(
+                "return [document.readyState, performance.getEntriesByType('resource').length];")
+            now = time.monotonic()
+            if count != state["count"] or ready != "complete":
+                state["count"], state["since"] = count, now
+                return False
+            return now - state["since"] >= idle_time
+
+        return self.wait_for(idle, timeout, poll) is not None
+
+    def scroll_until_stable(self, settle_timeout=1.5, timeout=30.0, max_rounds=100, poll=0.05,
+                            wait_network=False, return_to_top=True) -> dict:
+        """
+        페이지 맨 아래로 스크롤하며 지연 로딩되는 내용을 불러옵니다.
+        매번 문서 높이가 늘어나는지 짧은 간격으로 확인하고, settle_timeout 동안 늘지 않으면 멈춥니다.
+
+        Args:
+            settle_timeout (float): 스크롤 후 새 내용을 기다릴 최대 시간(초)
+            timeout (float): 전체 최대 시간(초)
+            max_rounds (int): 최대 스크롤 횟수
+            poll (float): 상태 확인 간격(초)
+            wait_network (bool): True이면 높이 변화 대신 네트워크 유휴 상태를 기다린 뒤 높이를 비교
+            return_to_top (bool): 끝나면 페이지 맨 위로 돌아갈지 여부
+
+        Returns:
+            dict: total_distance(총 스크롤 거리), height(최종 문서 높이), rounds(스크롤 횟수),
+                  elapsed_sec(전체 시간), round_times(회차별 시간), timed_out(전체 시간 초과 여부)
+        """
+        logging.debug("Scrolling until the page height is stable.")
         driver = self.driver
-        driver.find_element_by_tag_name('body').send_keys(Keys.END)
-        time.sleep(1)  # 스크롤이 내려가는 동안 대기
+        start = time.monotonic()
+        total_distance = 0
+        round_times = []
+        timed_out = False
+        height = None
 
-        # 스크롤이 이동한 거리 계산
-        scrollDistance = driver.execute_script("return window.pageYOffset;")
-        logging.debug(f"Scrolled distance: {scrollDistance} pixels.")
+        for _ in range(max_rounds):
+            round_start = time.monotonic()
+            step = driver.execute_script(self._SCROLL_TO_BOTTOM_JS)
+            height = step["height"]
+            wait_limit = max(0.0, min(settle_timeout, timeout - (round_start - start)))
+            if wait_network:
+                self.wait_for_network_idle(timeout=wait_limit, poll=poll)
+                new_height = self.get_scroll_state()["height"]
+                new_height = new_height if new_height != height else None
+            else:
+                new_height = self.wait_for_height_change(height, wait_limit, poll)
+            # 부드러운 스크롤을 쓰는 페이지는 위치가 늦게 확정되므로 실제 위치를 다시 읽는다
+            if new_height is None:
+                self.wait_for_scroll_settled(timeout=min(settle_timeout, 1.0), poll=poll)
+            after = self.get_scroll_state()["y"]
+            total_distance += after - step["before"]
+            round_times.append(time.monotonic() - round_start)
+            logging.debug(f"Scrolled {after - step['before']} pixels in {round_times[-1]:.2f}s.")
+            if new_height is None:
+                break
+            height = new_height
+            if time.monotonic() - start >= timeout:
+                timed_out = True
+                logging.warning(f"Scrolling stopped after {timeout}s before the page became stable.")
+                break
+
+        if return_to_top:
+            driver.execute_script("window.scrollTo({top: 0, left: 0, behavior: 'instant'});")
+        result = {
+            "total_distance": total_distance,
+            "height": height,
+            "rounds": len(round_times),
+            "elapsed_sec": time.monotonic() - start,
+            "round_times": round_times,
+            "timed_out": timed_out,
+        }
+        self.last_scroll_stats = result
+        logging.debug(f"Scroll finished: {result['total_distance']} pixels, {result['rounds']} rounds, "
+                      f"{result['elapsed_sec']:.2f}s.")
+        return result
 
-        # Home 키를 눌러 시작 위치로 복귀
-        driver.find_element_by_tag_name('body').send_keys(Keys.HOME)
-        time.sleep(1)  # 스크롤이 위로 올라가는 동안 대기
+    def getDistanceScrollToBtm(self):
+        """ 페이지 맨 아래까지의 스크롤 거리를 계산합니다. 실제로 스크롤하지 않고 한 번의 JS 호출로 구합니다. """
+        logging.debug("Calculating distance to the bottom of the page.")
+        state = self.get_scroll_state()
+        scrollDistance = max(0, state["height"] - state["viewport"])
+        logging.debug(f"Scrolled distance: {scrollDistance} pixels.")
         return scrollDistance
 
-    def get_scroll_distance_total(self):
-        def get_scroll_distance(driver):
-            driver = driver
-            # 현재 페이지의 스크롤 위치를 가져옵니다.
-            current_scroll_position = driver.execute_script("return window.scrollY || window.pageYOffset")
-            logging.debug(f"Current scroll position: {current_scroll_position} pixels.")
-            
-            # 스크롤 이벤트를 발생시킵니다.
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight)")
-            time.sleep(1)
-            
-            # 새로운 스크롤 위치를 가져옵니다.
-            new_scroll_position = driver.execute_script("return window.pageYOffset")
-            # 페이지 이동 거리를 계산합니다.
-            scroll_distance = new_scroll_position - current_scroll_position
-            logging.debug(f"Scrolled distance: {scroll_distance} pixels.")
-            return scroll_distance
-        
-        
-        """ 페이지 스크롤의 총 거리를 계산합니다. """
+    def get_scroll_distance_total(self, settle_timeout=1.5, timeout=30.0):
+        """ 페이지 스크롤의 총 거리를 계산합니다. 회차별 시간은 self.last_scroll_stats에 남습니다. """
         logging.debug("Calculating total scroll distance.")
-        total_scroll_distance = 0
-        prev_scroll_distance = -1
-        
-        while True:
-            scroll_distance = get_scroll_distance(self.driver)
-            total_scroll_distance += scroll_distance
-            if scroll_distance == 0 or scroll_distance == prev_scroll_distance:
-                break
-            prev_scroll_distance = scroll_distance
-        
-        # 초기 위치로 복귀하기 위해 페이지 맨 위로 스크롤합니다.
-        self.driver.execute_script("window.scrollTo(0, 0)")
-        time.sleep(1)
+        total_scroll_distance = self.scroll_until_stable(settle_timeout=settle_timeout,
+                                                         timeout=timeout)["total_distance"]
         logging.debug(f"Total scroll distance: {total_scroll_distance} pixels.")
         return total_scroll_distance
-    
-    
+
     def click_action(self, element):
         driver = self.driver
         driver.execute_script("arguments[0].click();", element)
@@ -0,0 +1,333 @@
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import WebDriverException
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from contextlib import contextmanager
+import atexit
+import copy
+import queue
+import threading
+import time
+import logging
+from urllib.parse import urlsplit
+from .webdriver import WebDriver
+
+# close() 후 대여를 기다리던 스레드를 깨우기 위해 큐에 넣는 표시
+_CLOSED = object()
+
+
+class WebDriverPool:
+    """
+    미리 띄워 둔 Chrome 드라이버를 여러 작업 스레드에 빌려주는 풀.
+    SELENIUM_URL 환경 변수가 있으면 원격 드라이버를, 없으면 로컬 Chrome을 사용한다.
+    - 반납할 때 새 탭만 남기고, 로컬 Chrome은 CDP로 모든 도메인의 쿠키와 방문한 origin의 스토리지를 지운다
+      (CDP를 쓸 수 없는 원격 드라이버는 다른 도메인 상태를 지울 수 없으므로 새 드라이버로 교체한다)
+    - max_uses번 사용했거나 비정상 종료된 드라이버는 새 드라이버로 교체한다
+    - 대여 대기 시간과 사용률을 stats()로 확인할 수 있다
+    드라이버는 프로세스 사이에 넘길 수 없으므로 프로세스 단위 병렬 처리는 map_urls_in_processes를 사용한다.
+
+    # 예시
+    def scrape(web, url):
+        web.driver.get(url)
+        return web.driver.title
+
+    with WebDriverPool(size=4, headless=True) as pool:
+        titles = pool.map_urls(scrape, urls)
+        with pool.lease() as web:
+            web.driver.get(url)
+        print(pool.stats())
+    """
+
+    def __init__(self, size: int = 4, headless=True, max_uses: int = 50, prewarm=True):
+        """
+        Args:
+            size (int): 풀에 둘 드라이버 수
+            headless (bool): 헤드리스 모드 여부
+            max_uses (int): 드라이버 하나를 교체하기 전까지 빌려줄 최대 횟수. None이면 교체하지 않는다
+            prewarm (bool): True이면 생성 시 드라이버를 모두 띄우고, 교체도 백그라운드에서 미리 한다
+        """
+        self.size = size
+        self.headless = headless
+        self.max_uses = max_uses
+        self.prewarm = prewarm
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._started_at = time.monotonic()
+        # Chrome 설치 확인과 Options 구성은 풀을 만들 때 한 번만 하고, 모든 드라이버가 이 값을 함께 쓴다
+        self._template = WebDriver(headless=headless)
+        if self._template.SELENIUM_URL is None:
+            self._template.chrome_options.binary_location = str(self._template.browser_path)
+        self.leases = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.busy_total = 0.0
+        self.created = 0
+        self.recycled = 0
+        self.crashed = 0
+
+        if prewarm:
+            with ThreadPoolExecutor(max_workers=size) as executor:
+                for entry in executor.map(lambda _: self._try_create(), range(size)):
+                    self._idle.put(entry)
+        else:
+            for _ in range(size):
+                self._idle.put(None)  # 처음 빌려줄 때 드라이버를 띄운다
+        logging.info(f"WebDriverPool ready with {size} slots (prewarm={prewarm}).")
+
+    def _start_driver(self):
+        template = self._template
+        if template.SELENIUM_URL is None:
+            service = Service(executable_path=str(template.webdriver_path))
+            return webdriver.Chrome(service=service, options=template.chrome_options)
+        return webdriver.Remote(command_executor=template.SELENIUM_URL, options=template.chrome_options)
+
+    def _create(self) -> dict:
+        start = time.monotonic()
+        web = copy.copy(self._template)
+        web.driver = self._start_driver()
+        web.last_scroll_stats = None
+        entry = {"web": web, "uses": 0}
+        with self._lock:
+            self.created += 1
+        logging.debug(f"Started a pooled Chrome driver in {time.monotonic() - start:.2f}s.")
+        return entry
+
+    def _try_create(self):
+        try:
+            return self._create()
+        except Exception as e:
+            logging.error(f"Failed to start Chrome driver: {e}")
+            return None  # 빈 자리는 다음 대여 때 다시 띄운다
+
+    @staticmethod
+    def _quit(entry):
+        try:
+            entry["web"].driver.quit()
+        except Exception as e:
+            logging.debug(f"Error while quitting driver: {e}")
+
+    def _replace(self, entry):
+        """
+        드라이버를 종료하고 자리를 채운다. prewarm이면 새 드라이버를 백그라운드에서 띄운다.
+        """
+        self._quit(entry)
+        if self._closed:
+            return
+        if self.prewarm:
+            threading.Thread(target=self._refill, daemon=True).start()
+        else:
+            self._idle.put(None)
+
+    def _refill(self):
+        entry = self._try_create()
+        if not self._closed:
+            self._idle.put(entry)
+        elif entry is not None:
+            self._quit(entry)
+
+    @staticmethod
+    def _is_alive(driver) -> bool:
+        try:
+            driver.window_handles
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _history_origins(driver) -> set:
+        history = driver.execute_cdp_cmd("Page.getNavigationHistory", {})
+        origins = set()
+        for item in history.get("entries", []):
+            parts = urlsplit(item.get("url", ""))
+            if parts.scheme in ("http", "https"):
+                origins.add(f"{parts.scheme}://{parts.netloc}")
+        return origins
+
+    @staticmethod
+    def _reset(driver) -> bool:
+        """
+        다음 작업이 이전 작업의 상태를 보지 않도록 브라우저 상태를 정리한다.
+        빈 탭을 새로 열고 기존 탭을 모두 닫아 sessionStorage와 방문 기록을 버린 뒤,
+        CDP로 모든 도메인의 쿠키와 각 탭에서 방문한 origin의 스토리지를 지운다.
+
+        Returns:
+            bool: 브라우저 전체 상태를 지웠으면 True. CDP를 쓸 수 없어 지우지 못했으면 False (드라이버를 교체해야 한다)
+        """
+        cdp = hasattr(driver, "execute_cdp_cmd")
+        origins = set()
+        handles = driver.window_handles
+        if cdp:
+            for handle in handles:
+                driver.switch_to.window(handle)
+                origins |= WebDriverPool._history_origins(driver)
+        driver.switch_to.new_window("tab")
+        fresh = driver.current_window_handle
+        for handle in handles:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(fresh)
+        if not cdp:
+            return False
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        for origin in origins:
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+        return True
+
+    @contextmanager
+    def lease(self, timeout: float = None):
+        """
+        드라이버를 하나 빌려주는 컨텍스트 매니저. WebDriver 객체를 반환하며 블록이 끝나면 풀에 돌려놓는다.
+
+        Args:
+            timeout (float): 빈 드라이버를 기다릴 최대 시간(초). None이면 계속 기다린다
+        """
+        if self._closed:
+            raise RuntimeError("WebDriverPool is closed.")
+        wait_start = time.monotonic()
+        try:
+            entry = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No WebDriver became available within {timeout}s.")
+        if entry is _CLOSED:
+            self._idle.put(_CLOSED)  # 함께 기다리던 다른 스레드도 깨운다
+            raise RuntimeError("WebDriverPool is closed.")
+        if entry is None:
+            try:
+                entry = self._create()
+            except Exception:
+                self._idle.put(None)
+                raise
+        waited = time.monotonic() - wait_start
+        with self._lock:
+            self.leases += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+
+        busy_start = time.monotonic()
+        entry["uses"] += 1
+        healthy = True
+        clean = True
+        try:
+            yield entry["web"]
+        except WebDriverException:
+            healthy = self._is_alive(entry["web"].driver)
+            raise
+        finally:
+            with self._lock:
+                self.busy_total += time.monotonic() - busy_start
+            if healthy:
+                try:
+                    clean = self._reset(entry["web"].driver)
+                except Exception as e:
+                    logging.warning(f"Failed to reset driver, replacing it: {e}")
+                    healthy = False
+            if self._closed:
+                self._quit(entry)
+            elif not healthy:
+                with self._lock:
+                    self.crashed += 1
+                self._replace(entry)
+            elif not clean or (self.max_uses is not None and entry["uses"] >= self.max_uses):
+                with self._lock:
+                    self.recycled += 1
+                self._replace(entry)
+            else:
+                self._idle.put(entry)
+
+    def map_urls(self, func, urls, timeout: float = None, return_exceptions=True) -> list:
+        """
+        func(web, url)을 URL마다 풀의 드라이버로 병렬 실행하는 함수. func 안에서 web.driver.get(url)을 호출한다.
+
+        Args:
+            func (callable): (WebDriver, url)을 받아 결과를 반환하는 함수
+            urls (list): URL 리스트
+            timeout (float): 드라이버 대여 대기 시간(초)
+            return_exceptions (bool): True이면 실패한 URL의 결과 자리에 예외 객체를 넣고, False이면 예외를 발생시킨다
+
+        Returns:
+            list: URL 순서대로의 결과
+        """
+        def run(url):
+            try:
+                with self.lease(timeout) as web:
+                    return func(web, url)
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                logging.error(f"Failed to scrape {url}: {e}")
+                return e
+
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            return list(executor.map(run, urls))
+
+    @staticmethod
+    def map_urls_in_processes(func, urls, processes: int = 2, drivers_per_process: int = 1,
+                              return_exceptions=True, **pool_kwargs) -> list:
+        """
+        프로세스마다 WebDriverPool을 하나씩 만들어 func(web, url)을 실행하는 함수.
+        func는 pickle할 수 있도록 모듈 최상위에 정의해야 한다. pool_kwargs는 WebDriverPool 인자로 전달된다.
+        """
+        pool_kwargs["size"] = drivers_per_process
+        urls = list(urls)
+        chunks = [urls[i::processes] for i in range(processes)]
+        results = [None] * len(urls)
+        with ProcessPoolExecutor(max_workers=processes, initializer=_init_process_pool,
+                                 initargs=(pool_kwargs,)) as executor:
+            futures = [executor.submit(_map_in_process, func, chunk, return_exceptions) for chunk in chunks]
+            for i, future in enumerate(futures):
+                results[i::processes] = future.result()
+        return results
+
+    def stats(self) -> dict:
+        """
+        대여 횟수, 대기 시간, 사용률(드라이버가 빌려진 시간 / 전체 드라이버 시간), 교체 횟수를 반환하는 함수.
+        """
+        with self._lock:
+            elapsed = time.monotonic() - self._started_at
+            return {
+                "size": self.size,
+                "idle": self._idle.qsize(),
+                "leases": self.leases,
+                "wait_avg_sec": self.wait_total / self.leases if self.leases else 0.0,
+                "wait_max_sec": self.wait_max,
+                "utilization": self.busy_total / (elapsed * self.size) if elapsed > 0 else 0.0,
+                "created": self.created,
+                "recycled": self.recycled,
+                "crashed": self.crashed,
+            }
+
+    def close(self):
+        """
+        풀에 있는 모든 드라이버를 종료하는 함수. 빌려준 드라이버는 반납될 때 종료된다.
+        """
+        self._closed = True
+        while True:
+            try:
+                entry = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if entry is not None and entry is not _CLOSED:
+                self._quit(entry)
+        self._idle.put(_CLOSED)
+        logging.info(f"WebDriverPool closed. {self.stats()}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+# map_urls_in_processes의 작업 프로세스마다 하나씩 만드는 풀
+_process_pool = None
+
+
+def _init_process_pool(pool_kwargs):
+    global _process_pool
+    _process_pool = WebDriverPool(**pool_kwargs)
+    atexit.register(_process_pool.close)
+
+
+def _map_in_process(func, urls, return_exceptions):
+    return _process_pool.map_urls(func, urls, return_exceptions=return_exceptions)